@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import os
-from arch.crawler import crawl_package, render_tree, to_json
+from arch.crawler import crawl_package, write_json
+from arch.viewer import render_tree
 
 # Path to the target Python package/repository to crawl
 path = r"C:\gdrive\algorithms\deltares\HYDROLIB-core\hydrolib\core\base"
 
 
-model = crawl_package(path)
-print(render_tree(model))
+if __name__ == "__main__":
+    # the guard is required once workers > 1: on Windows/macOS every worker process re-imports this script
+    model = crawl_package(path, workers=None)
+    print(render_tree(model))
 
-# Optionally save a JSON snapshot next to this script for further analysis
-out_dir = os.path.dirname(os.path.abspath(__file__))
-out_json = os.path.join(out_dir, "structure.json")
-with open(out_json, "w", encoding="utf-8") as f:
-    f.write(to_json(model, indent=2))
-print(f"\nJSON structure written to: {out_json}")
+    # Optionally save a JSON snapshot next to this script for further analysis
+    out_dir = os.path.dirname(os.path.abspath(__file__))
+    out_json = os.path.join(out_dir, "structure.json")
+    with open(out_json, "wb") as f:
+        write_json(model, f)
+    print(f"\nJSON structure written to: {out_json}")
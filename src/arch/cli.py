@@ -1,5 +1,6 @@
+import sys
 from typing import List, Optional
-from arch.crawler import crawl_package, to_json
+from arch.crawler import DEFAULT_CACHE_PATH, crawl_package, to_json, to_json_bytes
 from arch.viewer import render_tree
 
 
@@ -39,11 +40,35 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("path", help="Path to the root directory of the package or repository")
     parser.add_argument("--format", choices=["tree", "json"], default="tree", help="Output format")
     parser.add_argument("--indent", type=int, default=2, help="JSON indent")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Worker processes used for parsing (default: 1, i.e. serial; 0 uses the CPU count)",
+    )
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument(
+        "--cache", dest="cache", default=None, metavar="PATH",
+        help="Reuse parse results of unchanged files across runs, stored in PATH",
+    )
+    cache.add_argument(
+        "--cache-default", dest="cache", action="store_const", const=DEFAULT_CACHE_PATH,
+        help=f"Same as --cache with the default file ({DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="Scan files line by line instead of parsing them (faster, best-effort results)",
+    )
     args = parser.parse_args(argv)
 
-    model = crawl_package(args.path)
+    workers = args.workers or None
+    model = crawl_package(args.path, workers=workers, cache_path=args.cache, fast=args.fast)
     if args.format == "json":
-        print(to_json(model, indent=args.indent))
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            print(to_json(model, indent=args.indent))
+        else:
+            sys.stdout.flush()
+            out.write(to_json_bytes(model, indent=args.indent) + b"\n")
+            out.flush()
     else:
         print(render_tree(model))
     return 0
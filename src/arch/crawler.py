@@ -1,30 +1,61 @@
 from __future__ import annotations
 
+import os
+import sys
 import json
-from pathlib import Path
-from typing import Dict, List, Iterable
+import hashlib
+from itertools import islice, repeat
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from typing import Any, BinaryIO, Dict, List, Iterable, Optional, Tuple
 from arch.data_models import Package, Module
 
+try:
+    import orjson
+except ImportError:  # optional dependency, installed with the "fast-json" extra
+    orjson = None
+
 # Public API surface of this module:
-# - crawl_package(path: str) -> Dict
+# - crawl_package(path: str, workers: Optional[int] = 1, cache_path: Optional[str] = None, fast: bool = False) -> Package
 # - render_tree(model: Dict) -> str
-# - to_json(model: Dict, indent: int = 2) -> str
+# - to_json(model: Package | Dict, indent: int = 2) -> str
+# - to_json_bytes(model: Package | Dict, indent: int = 2) -> bytes
+# - write_json(model: Package, fp: BinaryIO) -> None
 # - main(argv: Optional[List[str]] = None) -> int
 
-IGNORED_DIRS = {
-    "__pycache__",
-    ".git",
-    ".hg",
-    ".svn",
-    ".tox",
-    ".mypy_cache",
-    ".pytest_cache",
-    ".venv",
-    "venv",
-    "env",
-    "build",
-    "dist",
-}
+IGNORED_DIRS = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        ".hg",
+        ".svn",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".venv",
+        "venv",
+        "env",
+        "build",
+        "dist",
+    }
+)
+
+# File suffixes treated as Python modules, in the tuple form accepted by str.endswith.
+PYTHON_SUFFIXES = (".py",)
+
+# Below this many files the process pool start-up costs more than it saves.
+PARALLEL_MIN_FILES = 16
+# Upper bound on the files handed to a worker per round-trip; amortizes pickling/IPC over many small modules.
+PARALLEL_CHUNKSIZE = 32
+# Edges encoded per encoder call by write_json; bounds the transient dicts while streaming the edge list.
+EDGE_BATCH_SIZE = 1024
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "arch",
+    "parse_cache.json",
+)
 
 
 def _is_package_dir(path: str) -> bool:
@@ -64,18 +95,31 @@ def _is_package_dir(path: str) -> bool:
 
         ```
     """
-    p = Path(path)
-    return p.is_dir() and (p / "__init__.py").is_file()
+    # a single stat: the file can only exist if ``path`` is a directory
+    return os.path.isfile(os.path.join(path, "__init__.py"))
+
 
+def _iter_python_files(
+    root: str, packages: Optional[List[Tuple[str, ...]]] = None
+) -> Iterable[Tuple[os.DirEntry, str]]:
+    """Yield directory entries and dotted module names for Python files under a root directory.
 
-def _iter_python_files(root: str) -> Iterable[str]:
-    """Yield absolute paths to Python files under a root directory.
+    The tree is walked with an explicit stack of ``os.scandir`` calls, so every directory is listed exactly
+    once and the file-type information returned by ``readdir`` is reused instead of issuing extra ``stat``
+    calls per entry. Each stack item carries the dotted prefix of its directory, so module names are built
+    from the names already at hand instead of re-deriving them from the full path.
 
     Args:
         root (str): Absolute or relative path to the directory to scan.
+        packages (Optional[List[Tuple[str, ...]]]): If given, the path parts (relative to ``root``) of every
+            directory found to contain an ``__init__.py`` are appended to it while walking, ``()`` being the
+            root itself. ``_discover_roots`` reuses this instead of listing the root again.
 
     Returns:
-        Iterable[str]: Generator of absolute file paths to ``.py`` files. Directories listed in ``IGNORED_DIRS`` are skipped.
+        Iterable[Tuple[os.DirEntry, str]]: Generator of ``(entry, dotted_name)`` pairs for files ending in one
+        of ``PYTHON_SUFFIXES`` (dotfiles excluded); ``entry.path`` is absolute and ``dotted_name`` is relative
+        to ``root`` (``__init__.py`` maps to its package, so the root's own ``__init__.py`` maps to ``""``).
+        Directories listed in ``IGNORED_DIRS`` are pruned and symlinked directories are not followed.
 
     Examples:
     - Find Python files beneath a temporary directory
@@ -85,22 +129,35 @@ def _iter_python_files(root: str) -> Iterable[str]:
         >>> with tempfile.TemporaryDirectory() as d:
         ...     _ = open(os.path.join(d, "a.py"), "w", encoding="utf-8").close()
         ...     os.mkdir(os.path.join(d, "sub"))
+        ...     _ = open(os.path.join(d, "sub", "__init__.py"), "w", encoding="utf-8").close()
         ...     _ = open(os.path.join(d, "sub", "b.py"), "w", encoding="utf-8").close()
-        ...     files = sorted(os.path.basename(p) for p in _iter_python_files(d))
-        >>> files
-        ['a.py', 'b.py']
+        ...     found = sorted((entry.name, dotted) for entry, dotted in _iter_python_files(d))
+        >>> found
+        [('__init__.py', 'sub'), ('a.py', 'a'), ('b.py', 'sub.b')]
 
         ```
     """
-    root_path = Path(root).absolute()
-    for p in root_path.rglob("*.py"):
-        # Skip any files that are inside ignored directories
-        if any(part in IGNORED_DIRS for part in p.parts):
+    stack = [(os.path.abspath(root), ())]
+    while stack:
+        current, parts = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in IGNORED_DIRS:
+                            stack.append((entry.path, parts + (sys.intern(name),)))
+                    elif name.endswith(PYTHON_SUFFIXES) and name[0] != "." and entry.is_file():
+                        # dotfiles are never importable
+                        stem = name.rpartition(".")[0]
+                        if stem == "__init__" and packages is not None:
+                            packages.append(parts)
+                        yield entry, sys.intern(".".join(parts if stem == "__init__" else parts + (stem,)))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             continue
-        yield str(p.absolute())
 
 
-def _discover_roots(root: str) -> List[str]:
+def _discover_roots(root: str, packages: Optional[Iterable[Tuple[str, ...]]] = None) -> List[str]:
     """Discover top-level Python package directories under a filesystem root.
 
     A directory is considered a root package if it contains an ``__init__.py`` file.
@@ -110,6 +167,8 @@ def _discover_roots(root: str) -> List[str]:
 
     Args:
         root (str): Absolute or relative path to scan for Python packages.
+        packages (Optional[Iterable[Tuple[str, ...]]]): Package directories already collected by
+            ``_iter_python_files``. When given, no filesystem access is needed; otherwise the root is listed.
 
     Returns:
         List[str]: Names of discovered top-level package directories (not full paths).
@@ -148,17 +207,26 @@ def _discover_roots(root: str) -> List[str]:
 
         ```
     """
-    # If the given root is itself a Python package, consider it a root.
     roots: List[str] = []
-    if _is_package_dir(root):
-        roots.append(Path(root).name)
-    # Also include any immediate sub-directories that are packages
-    try:
-        for p in Path(root).iterdir():
-            if p.is_dir() and _is_package_dir(str(p)):
-                roots.append(p.name)
-    except FileNotFoundError:
-        pass
+    if packages is not None:
+        # the root itself is () and its immediate sub-directories have a single part
+        for parts in packages:
+            if not parts:
+                roots.append(os.path.basename(os.path.abspath(root)))
+            elif len(parts) == 1:
+                roots.append(parts[0])
+    else:
+        # If the given root is itself a Python package, consider it a root.
+        if _is_package_dir(root):
+            roots.append(os.path.basename(os.path.abspath(root)))
+        # Also include any immediate sub-directories that are packages
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir() and _is_package_dir(entry.path):
+                        roots.append(entry.name)
+        except FileNotFoundError:
+            pass
     # De-duplicate while preserving order
     seen = set()
     out: List[str] = []
@@ -169,28 +237,192 @@ def _discover_roots(root: str) -> List[str]:
     return out
 
 
-def crawl_package(root_path: str) -> Package:
+def _digest(source: bytes) -> str:
+    """Content digest used by ``_ParseCache`` to recognize files that were rewritten with the same bytes."""
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as fh:
+            return _digest(fh.read())
+    except OSError:
+        return None
+
+
+def _valid_entry(entry: Any) -> bool:
+    # [st_mtime_ns, st_size, content digest, Module.to_dict()] as written by _ParseCache.put
+    return (
+        isinstance(entry, list)
+        and len(entry) == 4
+        and type(entry[0]) is int
+        and type(entry[1]) is int
+        and isinstance(entry[2], str)
+        and isinstance(entry[3], dict)
+    )
+
+
+class _ParseCache:
+    """Persistent ``file path -> Module`` cache for incremental re-crawls.
+
+    An entry is reused when the file's ``(st_mtime_ns, st_size)`` still match the values recorded when it was
+    parsed, the same staleness check build tools use, so unchanged files cost one ``stat`` instead of a
+    read and parse. When only the modification time differs (fresh clones, checkouts, ``touch``) the content
+    digest decides, so files whose bytes are unchanged still skip the parser. The cache is stored as JSON
+    holding each module's ``to_dict`` form.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: str, entries: Dict[str, list]):
+        self.path = path
+        # file path -> [st_mtime_ns, st_size, content digest, Module.to_dict()]
+        self.entries = entries
+        # file path -> (st_mtime_ns, st_size) of every file visited in this crawl
+        self._seen: Dict[str, Tuple[int, int]] = {}
+        # lookups served from / missing in the cache during this crawl, for diagnostics
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: str) -> "_ParseCache":
+        try:
+            with open(path, "rb") as fh:
+                data = json.loads(fh.read())
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return cls(path, {})
+        entries = data.get("entries")
+        if not isinstance(entries, dict) or not all(_valid_entry(e) for e in entries.values()):
+            # written by something else or damaged: start from a cold cache, as for another version
+            return cls(path, {})
+        return cls(path, entries)
+
+    def get(self, entry: os.DirEntry, dotted_name: str) -> Optional[Module]:
+        st = entry.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        self._seen[entry.path] = key
+        cached = self.entries.get(entry.path)
+        if cached is None or cached[1] != key[1]:
+            self.misses += 1
+            return None
+        if cached[0] != key[0]:
+            # same size, new mtime: reuse the entry only if the content is unchanged, and record the new mtime
+            if _file_digest(entry.path) != cached[2]:
+                self.misses += 1
+                return None
+            cached[0] = key[0]
+        self.hits += 1
+        mod = Module.from_dict(cached[3])
+        # the same file gets a different dotted name when crawled from another root
+        mod.name = dotted_name or os.path.basename(os.path.dirname(entry.path))
+        return mod
+
+    def put(self, file_path: str, mod: Module, stamp: Tuple[int, int, str]) -> None:
+        # stamp: (st_mtime_ns, st_size, digest) of the read that was parsed, see _parse_file
+        mtime_ns, size, digest = stamp
+        self.entries[file_path] = [mtime_ns, size, digest, mod.to_dict()]
+
+    def save(self, root: str) -> None:
+        # forget files under the crawled root that no longer exist
+        prefix = os.path.join(root, "")
+        for stale in [p for p in self.entries if p.startswith(prefix) and p not in self._seen]:
+            del self.entries[stale]
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                fh.write(to_json_bytes({"version": self.VERSION, "entries": self.entries}, indent=None))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # the cache is an optimization only; a read-only location must not fail the crawl
+            pass
+
+
+def _chunksize(n_files: int, workers: int) -> int:
+    """Files per task: about four tasks per worker for load balancing, capped at ``PARALLEL_CHUNKSIZE``.
+
+    Examples:
+    - A medium tree still reaches every worker, a large one uses the full chunk size
+        ```python
+
+        >>> _chunksize(100, 8), _chunksize(10_000, 8), _chunksize(20, 8)
+        (3, 32, 1)
+
+        ```
+    """
+    return max(1, min(PARALLEL_CHUNKSIZE, n_files // (4 * workers)))
+
+
+def _parse_file(
+    file_path: str, root: str, dotted_name: str, fast: bool = False, stamp: bool = False
+) -> Tuple[Optional[Module], Optional[Tuple[int, int, str]]]:
+    """Parse one file into a Module; module-level so it can be pickled into worker processes.
+
+    With ``stamp`` the second item is ``(st_mtime_ns, st_size, digest)`` for ``_ParseCache.put``, taken from the
+    same read that was parsed, so the cache entry describes exactly the bytes behind the module.
+    """
+    if fast:
+        return Module.scan_file(file_path, root, dotted_name), None
+    if not stamp:
+        return Module.from_file(file_path, root, dotted_name), None
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            # stat before reading: a write racing the read leaves an older mtime, which the next crawl re-checks
+            st = os.fstat(fd)
+            source = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None, None
+    mod = Module.from_file(file_path, root, dotted_name, source)
+    return mod, (st.st_mtime_ns, len(source), _digest(source))
+
+
+def crawl_package(
+    root_path: str, workers: Optional[int] = 1, cache_path: Optional[str] = None, fast: bool = False
+) -> Package:
     """Crawl a directory for Python packages and build a serializable model.
 
     The crawler walks the directory tree under ``root_path``, finds Python modules,
     parses them to extract classes, functions, and imports, discovers top-level
-    package roots, and finally returns a JSON-serializable dictionary.
+    package roots, and finally returns a ``Package`` model (``to_dict``/``write_json`` serialize it).
+
+    Files are parsed serially in the calling process by default. With ``workers`` above 1 and at least
+    ``PARALLEL_MIN_FILES`` files to parse, the parsing is spread over a ``ProcessPoolExecutor`` instead. Results
+    are plain slotted dataclasses, so they pickle back from the workers cheaply.
+
+    On platforms that spawn workers (Windows, macOS) every worker re-imports the calling script, so a script that
+    asks for more than one worker must call ``crawl_package`` under an ``if __name__ == "__main__":`` guard;
+    without it the workers fail and the pool raises ``BrokenProcessPool``.
 
     Args:
         root_path (str): Path to the root directory of the package or repository to crawl.
+        workers (Optional[int]): Number of worker processes used for parsing. Defaults to ``1`` (serial
+            parsing, no processes are started); ``None`` uses ``os.cpu_count()``. See the ``__main__`` guard
+            requirement above for values other than ``1``.
+        cache_path (Optional[str]): JSON file used to persist parse results between crawls (e.g.
+            ``DEFAULT_CACHE_PATH``). Files whose modification time and size are unchanged are not parsed again.
+            ``None`` (the default) disables the cache.
+        fast (bool): Scan files line by line with ``Module.scan_file`` instead of parsing them with ``ast``.
+            Much faster on large trees but best-effort (no decorators, bases as written). Scanned modules are
+            never written to the cache.
 
     Returns:
-        Dict: A dictionary with keys:
+        Package: The crawled model, with:
             - ``root_path`` (str): Absolute root path that was crawled.
             - ``roots`` (List[str]): Discovered top-level package names.
-            - ``modules`` (Dict[str, Any]): Dotted module name -> description dict.
-            - ``edges`` (List[Dict[str, str]]): Relationships between modules, classes, and functions.
+            - ``modules`` (Dict[str, Module]): Dotted module name -> parsed module, in name order.
+            Its relationships between modules, classes, and functions are computed on demand by ``build_edges``
+            and included under the ``edges`` key of ``to_dict``.
 
     Raises:
         None: Invalid files or non-parseable sources are skipped silently.
 
     Examples:
-    - Crawl a tiny temporary package and inspect keys
+    - Crawl a tiny temporary package and inspect the model
         ```python
 
         >>> import os, tempfile
@@ -202,46 +434,120 @@ def crawl_package(root_path: str) -> Package:
         ...     with open(mpy, 'w', encoding='utf-8') as fh:
         ...         _ = fh.write('class A:\\n    pass\\n')
         ...     model = crawl_package(d)
-        ...     sorted(model.keys())
-        ['edges', 'modules', 'root_path', 'roots']
+        >>> sorted(model.modules), model.roots
+        (['pkg', 'pkg.m'], ['pkg'])
 
         ```
     - Check that the discovered module and class appear
         ```python
 
-        >>> 'pkg.m' in model['modules']
+        >>> 'pkg.m' in model.modules
         True
-        >>> any(e['type'] == 'module_contains' and e['to'].endswith('.A') for e in model['edges'])
+        >>> any(e['type'] == 'module_contains' and e['to'].endswith('.A') for e in model.to_dict()['edges'])
         True
 
         ```
 
     See Also:
-        Package: In-memory format used before conversion to dict.
+        Package: The returned model; ``to_dict`` converts it to plain data.
         build_edges: Generates the relationships included in the output.
     """
-    abs_root = Path(root_path).absolute()
-    modules: Dict[str, Module] = {}
-
-    for file_path in _iter_python_files(abs_root):
-
-        mod = Module.from_file(file_path, abs_root)
+    root = os.path.abspath(root_path)
+    # (name, module) pairs, turned into the modules dict once at the end so it is sized in one go; they are
+    # sorted by name first, so the sorts in to_dict/to_json/write_json see presorted input and run in linear time
+    items: List[Tuple[str, Module]] = []
+
+    cache = _ParseCache.load(cache_path) if cache_path is not None else None
+    paths: List[str] = []
+    names: List[str] = []
+    packages: List[Tuple[str, ...]] = []
+    for entry, dotted_name in _iter_python_files(root, packages):
+        if cache is not None:
+            mod = cache.get(entry, dotted_name)
+            if mod is not None:
+                items.append((mod.name, mod))
+                continue
+        paths.append(entry.path)
+        names.append(dotted_name)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # scanned modules are never cached, so only full parses need the stat and digest
+    stamp = cache is not None and not fast
+    if workers > 1 and len(paths) >= PARALLEL_MIN_FILES:
+        workers = min(workers, len(paths))
+        chunksize = _chunksize(len(paths), workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(
+                executor.map(
+                    _parse_file, paths, repeat(root), names, repeat(fast), repeat(stamp), chunksize=chunksize
+                )
+            )
+    else:
+        parsed = (_parse_file(path, root, name, fast, stamp) for path, name in zip(paths, names))
+
+    for path, (mod, file_stamp) in zip(paths, parsed):
         if mod is None:
             continue
 
-        modules[mod.name] = mod
+        items.append((mod.name, mod))
+        if file_stamp is not None:
+            cache.put(path, mod, file_stamp)
+
+    if cache is not None:
+        cache.save(root)
 
     model = Package(
-        root_path=str(abs_root), roots=_discover_roots(abs_root), modules=modules
+        root_path=root, roots=_discover_roots(root, packages), modules=dict(sorted(items, key=itemgetter(0)))
     )
     return model
 
 
-def to_json(model_dict: Dict, indent: int = 2) -> str:
-    """Serialize a model dictionary to a JSON string.
+# dataclass type -> names of the fields emitted in its JSON object
+_JSON_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _encode(obj: Any) -> Any:
+    """``default`` hook for ``json.dumps`` that encodes the data model objects without ``to_dict``.
+
+    Only one level is converted per call; nested ``Module``/``Class``/``Function`` objects are handed back to
+    the C encoder, which calls this hook again when it reaches them.
+    """
+    if isinstance(obj, Package):
+        return {
+            "root_path": obj.root_path,
+            "roots": obj.roots,
+            "modules": dict(sorted(obj.modules.items())),
+            "edges": [e.to_dict() for e in obj.build_edges()],
+        }
+    names = _JSON_FIELDS.get(type(obj))
+    if names is None:
+        try:
+            names = tuple(f.name for f in fields(obj) if not f.name.startswith("_"))
+        except TypeError:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable") from None
+        _JSON_FIELDS[type(obj)] = names
+    return {name: getattr(obj, name) for name in names}
+
+
+def _orjson_dumps(model_dict: Package | Dict, indent: Optional[int]) -> bytes:
+    # orjson serializes dataclasses natively; only the Package needs the hook (sorted modules + edges)
+    if isinstance(model_dict, Package):
+        model_dict = _encode(model_dict)
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(model_dict, default=_encode, option=option)
+
+
+def to_json(model_dict: Package | Dict, indent: int = 2) -> str:
+    """Serialize a model to a JSON string.
+
+    A ``Package`` is encoded directly, walking the data model objects instead of building the intermediate
+    ``to_dict`` tree first; the output is identical to ``json.dumps(model.to_dict())``. When the optional
+    ``orjson`` package is installed it is used as the encoder; it only supports two-space indentation, so any
+    non-zero ``indent`` produces two spaces and ``0``/``None`` produce compact output.
 
     Args:
-        model_dict (Dict): Model as produced by ``crawl_package``.
+        model_dict (Package | Dict): Model as produced by ``crawl_package``, or its ``to_dict`` form.
         indent (int, optional): Indentation level passed to ``json.dumps``. Defaults to 2.
 
     Returns:
@@ -255,6 +561,92 @@ def to_json(model_dict: Dict, indent: int = 2) -> str:
         >>> isinstance(s, str) and '"roots"' in s
         True
 
+        ```
+    - Serialize a Package directly
+        ```python
+
+        >>> json.loads(to_json(Package(root_path='X', roots=[], modules={})))
+        {'root_path': 'X', 'roots': [], 'modules': {}, 'edges': []}
+
+        ```
+
+    See Also:
+        to_json_bytes: Same output as UTF-8 bytes, ready to be written to a binary file.
+    """
+    if orjson is None:
+        return json.dumps(model_dict, indent=indent, default=_encode)
+    return _orjson_dumps(model_dict, indent).decode("utf-8")
+
+
+def to_json_bytes(model_dict: Package | Dict, indent: int = 2) -> bytes:
+    """Serialize a model to UTF-8 encoded JSON.
+
+    With ``orjson`` installed this is the encoder's native output, so no intermediate ``str`` is created.
+
+    Args:
+        model_dict (Package | Dict): Model as produced by ``crawl_package``, or its ``to_dict`` form.
+        indent (int, optional): Indentation level, see ``to_json``. Defaults to 2.
+
+    Returns:
+        bytes: JSON representation of the model.
+
+    Examples:
+    - Serialize a tiny model
+        ```python
+
+        >>> to_json_bytes({'roots': []}, indent=0).replace(b" ", b"")
+        b'{"roots":[]}'
+
+        ```
+    """
+    if orjson is None:
+        return json.dumps(model_dict, indent=indent, default=_encode).encode("utf-8")
+    return _orjson_dumps(model_dict, indent)
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_encode)
+    return json.dumps(obj, default=_encode, separators=(",", ":")).encode("utf-8")
+
+
+def write_json(model: Package, fp: BinaryIO) -> None:
+    """Stream a model as compact JSON into a binary file object.
+
+    The document is written piece by piece: one module at a time, then the edges from ``Package.iter_edges`` in
+    batches of ``EDGE_BATCH_SIZE``. Neither the ``to_dict`` tree, the full edge list nor the JSON text is ever
+    held in memory, and the edges are not cached on the model unless ``build_edges`` already ran. The parsed
+    result is equal to ``model.to_dict()``.
+
+    Args:
+        model (Package): Model as produced by ``crawl_package``.
+        fp (BinaryIO): File object opened in binary mode, e.g. ``open(path, "wb")``.
+
+    Examples:
+    - Stream a tiny model into memory
+        ```python
+
+        >>> import io
+        >>> buf = io.BytesIO()
+        >>> write_json(Package(root_path='X', roots=['pkg'], modules={}), buf)
+        >>> json.loads(buf.getvalue())
+        {'root_path': 'X', 'roots': ['pkg'], 'modules': {}, 'edges': []}
+
         ```
     """
-    return json.dumps(model_dict, indent=indent)
+    write = fp.write
+    write(b'{"root_path":' + _dumps_compact(model.root_path))
+    write(b',"roots":' + _dumps_compact(model.roots))
+    write(b',"modules":{')
+    sep = b""
+    for name, mod in sorted(model.modules.items()):
+        write(sep + _dumps_compact(name) + b":" + _dumps_compact(mod))
+        sep = b","
+    write(b'},"edges":[')
+    sep = b""
+    edges = model.iter_edges()
+    for batch in iter(lambda: [e.to_dict() for e in islice(edges, EDGE_BATCH_SIZE)], []):
+        # one encoder call per batch: encode the edges as an array and splice in the items
+        write(sep + _dumps_compact(batch)[1:-1])
+        sep = b","
+    write(b"]}")
@@ -1,21 +1,60 @@
+import os
+import re
+import sys
 import ast
-from typing import List, Dict, Optional, Any
-from pathlib import Path
+from typing import List, Dict, Optional, Any, NamedTuple, Iterator
 from collections import defaultdict
 from dataclasses import dataclass, field
 from arch.utils import _extract_name
 from arch.mermaid import Style, render_function_diagram, render_class_diagram, render_module_diagram, render_package_diagram, render_module_dependency
 
 
-def get_filtered_objects(items):
-    groups = defaultdict(list)
-    for obj in items:
-        groups[type(obj)].append(obj)
+# edge types produced by the build_edges methods
+EDGE_MODULE_CONTAINS = "module_contains"
+EDGE_CLASS_CONTAINS = "class_contains"
+EDGE_INHERITS = "inherits"
+EDGE_IMPORTS = "imports"
 
-    return groups
 
+class Edge(NamedTuple):
+    """A relationship produced by ``build_edges``.
 
-@dataclass
+    Edges are plain tuples while the model is in memory; ``to_dict`` gives the ``type``/``from``/``to``
+    mapping used in the serialized output.
+
+    Args:
+        type (str): One of ``EDGE_MODULE_CONTAINS``, ``EDGE_CLASS_CONTAINS``, ``EDGE_INHERITS`` or ``EDGE_IMPORTS``.
+        src (str): Qualified name of the source (module or class).
+        dst (str): Qualified name of the target (class, function, method, base or imported module).
+
+    Examples:
+    - Serialize an import edge
+        ```python
+
+        >>> Edge(EDGE_IMPORTS, "pkg.m", "os").to_dict()
+        {'type': 'imports', 'from': 'pkg.m', 'to': 'os'}
+
+        ```
+    """
+
+    type: str
+    src: str
+    dst: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"type": self.type, "from": self.src, "to": self.dst}
+
+
+# Builds an Edge from a (type, src, dst) tuple without the Python-level __new__ that NamedTuple generates
+# (the same shortcut as Edge._make, minus its length check); used in the bulk loops of build_edges.
+_new_edge = tuple.__new__
+
+
+# node classes that define a function or method, built once instead of per checked node
+_FUNCTION_NODES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+
+
+@dataclass(slots=True)
 class Function:
     """Lightweight description of a top-level or method function discovered in a module.
 
@@ -41,8 +80,14 @@ class Function:
 
     @classmethod
     def from_tree_node(cls, node):
-        decorators = [_extract_name(d) for d in node.decorator_list]
-        return cls(name=node.name, lineno=node.lineno, decorators=decorators)
+        # identifiers from the parser are already interned; names joined by _extract_name are not.
+        # Plain names (@staticmethod, @property, ...) are the common case and are read directly.
+        # Most functions have no decorators at all; those skip the comprehension entirely.
+        decorator_list = node.decorator_list
+        decorators = [
+            d.id if type(d) is ast.Name else sys.intern(_extract_name(d)) for d in decorator_list
+        ] if decorator_list else []
+        return cls(node.name, node.lineno, decorators)
 
     def to_dict(self):
         return {
@@ -51,19 +96,20 @@ class Function:
             "decorators": self.decorators,
         }
 
-    def build_edges(self, module_name: str) -> Dict[str, str]:
-        return {
-                "type": "module_contains",
-                "from": module_name,
-                "to": f"{module_name}.{self.name}",
-            }
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Function":
+        """Rebuild a Function from the output of ``to_dict``."""
+        return cls(name=data["name"], lineno=data["lineno"], decorators=list(data["decorators"]))
+
+    def build_edges(self, module_name: str) -> List[Edge]:
+        return [Edge(EDGE_MODULE_CONTAINS, module_name, f"{module_name}.{self.name}")]
 
     def to_mermaid_class_diagram(self, detail_level: str = "all", include_decorators: bool = False) -> str:
         """Create a Mermaid class diagram string for this function by delegating to arch.mermaid."""
         return render_function_diagram(self, detail_level=detail_level, include_decorators=include_decorators)
 
 
-@dataclass
+@dataclass(slots=True)
 class Class:
     """Description of a class discovered in a module.
 
@@ -91,16 +137,9 @@ class Class:
 
     @classmethod
     def from_tree_node(cls, node):
-        bases = [_extract_name(b) for b in node.bases]
-        methods: List[Function] = []
-        for n in node.body:
-            if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                decorators = [_extract_name(d) for d in n.decorator_list]
-                methods.append(
-                    Function(
-                        name=n.name, lineno=n.lineno, decorators=decorators
-                    )
-                )
+        bases = [b.id if type(b) is ast.Name else sys.intern(_extract_name(b)) for b in node.bases]
+        function_from_node = Function.from_tree_node
+        methods = [function_from_node(n) for n in node.body if type(n) in _FUNCTION_NODES]
 
         return cls(
                 name=node.name, lineno=node.lineno, bases=bases, methods=methods
@@ -121,37 +160,105 @@ class Class:
             ],
         }
 
-    def build_edges(self, module_name: str):
-        edges = [
-            {
-                "type": "module_contains",
-                "from": module_name,
-                "to": f"{module_name}.{self.name}",
-            }
-        ]
-        # class -> method containment
-        for meth in self.methods:
-            edges.append(
-                {
-                    "type": "class_contains",
-                    "from": f"{module_name}.{self.name}",
-                    "to": f"{module_name}.{self.name}.{meth.name}",
-                }
-            )
-        # inheritance edges
-        for base in self.bases:
-            edges.append(
-                {"type": "inherits", "from": f"{module_name}.{self.name}", "to": base}
-            )
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Class":
+        """Rebuild a Class from the output of ``to_dict``."""
+        return cls(
+            name=data["name"],
+            lineno=data["lineno"],
+            bases=list(data["bases"]),
+            methods=[Function.from_dict(m) for m in data["methods"]],
+        )
 
-        return edges
+    def build_edges(self, module_name: str) -> List[Edge]:
+        # the qualified name is built once and shared by every edge starting at this class
+        qualname = f"{module_name}.{self.name}"
+        prefix = qualname + "."
+        # containment, class -> method containment and inheritance, each built as a sized list
+        return (
+            [Edge(EDGE_MODULE_CONTAINS, module_name, qualname)]
+            + [_new_edge(Edge, (EDGE_CLASS_CONTAINS, qualname, prefix + meth.name)) for meth in self.methods]
+            + [_new_edge(Edge, (EDGE_INHERITS, qualname, base)) for base in self.bases]
+        )
 
     def to_mermaid_class_diagram(self, include_relations: bool = True, detail_level: str = "all") -> str:
         """Create a Mermaid class diagram string for this class by delegating to arch.mermaid."""
         return render_class_diagram(self, include_relations=include_relations, detail_level=detail_level)
 
 
-@dataclass
+# Line-oriented patterns used by Module.scan_file: definitions, imports and any other statement, with their
+# indentation (an indented one can open a class body, one at column 0 ends it). Closing brackets are not
+# statements: they end multi-line class headers such as "class A(\n    Base,\n):".
+_SCAN_RE = re.compile(
+    rb"^(?P<indent>[ \t]*)(?:"
+    rb"(?P<is_async>async[ \t]+)?def[ \t]+(?P<func>\w+)"
+    rb"|class[ \t]+(?P<cls>\w+)[ \t]*(?:\((?P<bases>[^)\n]*)\))?"
+    rb"|import[ \t]+(?P<imp>[^\n#;]+)"
+    rb"|from[ \t]+(?P<frm>[\w.]+)[ \t]+import\b"
+    rb"|(?P<other>[^\s#)\]}]))",
+    re.MULTILINE,
+)
+
+
+_PAREN_RE = re.compile(rb"[()]")
+
+
+def _scan_header_end(source: bytes, start: int) -> int:
+    # offset just past the parenthesis closing the one at ``start``
+    depth = 0
+    for m in _PAREN_RE.finditer(source, start):
+        depth += 1 if m.group() == b"(" else -1
+        if not depth:
+            return m.end()
+    return len(source)
+
+
+def _scan_bases(text: bytes) -> List[str]:
+    # "Base, Generic[T], metaclass=M" -> ["Base", "Generic"], close to what _extract_name gives
+    bases = []
+    for part in text.decode("utf-8", "replace").split(","):
+        part = part.strip()
+        if part and "=" not in part:
+            bases.append(sys.intern(part.partition("[")[0].strip()))
+    return bases
+
+
+# Handlers for the statements of a module body that the crawler records. Each one appends to the
+# shared containers built in Module.from_file; any other statement type falls through to a no-op.
+def _add_class(node, classes, functions, async_functions, imports):
+    classes.append(Class.from_tree_node(node))
+
+
+def _add_function(node, classes, functions, async_functions, imports):
+    functions.append(Function.from_tree_node(node))
+
+
+def _add_async_function(node, classes, functions, async_functions, imports):
+    async_functions.append(Function.from_tree_node(node))
+
+
+def _add_import(node, classes, functions, async_functions, imports):
+    for alias in node.names:
+        if alias.name:
+            imports[sys.intern(alias.name)] = None
+
+
+def _add_import_from(node, classes, functions, async_functions, imports):
+    if node.module:
+        imports[sys.intern(node.module)] = None
+
+
+# statement classes are leaves, so an exact ``type(node)`` lookup replaces the isinstance chain.
+_TOP_LEVEL_DISPATCH = {
+    ast.ClassDef: _add_class,
+    ast.FunctionDef: _add_function,
+    ast.AsyncFunctionDef: _add_async_function,
+    ast.Import: _add_import,
+    ast.ImportFrom: _add_import_from,
+}
+
+
+@dataclass(slots=True)
 class Module:
     """Container describing a single Python module discovered under the root.
 
@@ -160,7 +267,8 @@ class Module:
         path (str): Absolute filesystem path to the module file.
         classes (List[Class]): Classes defined in this module.
         functions (List[Function]): Top-level functions defined in this module.
-        imports (List[str]): Imported module names (best-effort, based on static AST parsing).
+        imports (List[str]): Imported module names (best-effort, based on static AST parsing), without
+            duplicates and in the order they are first imported.
 
     Examples:
     - Construct a module description manually
@@ -228,63 +336,53 @@ class Module:
             'pkg'
             ```
         """
-        file_p = Path(file_path).resolve()
+        # pure string arithmetic: abspath normalizes without touching the filesystem (no resolve()/stat calls)
+        file_p = os.path.abspath(file_path)
 
         if root is not None:
-            root_path = Path(root).resolve()
-            try:
-                rel = file_p.relative_to(root_path)
-            except ValueError:
+            root_path = os.path.abspath(root)
+            prefix = root_path if root_path.endswith(os.sep) else root_path + os.sep
+            if file_p.startswith(prefix):
+                rel = file_p[len(prefix):]
+            else:
                 # Fallback to generic relative path computation if not under root
-                rel = Path(str(file_p).replace(str(root_path), "").lstrip("/\\"))
+                rel = file_p.replace(root_path, "").lstrip("/\\")
         else:
-            rel = Path(str(file_p).lstrip("/\\"))
+            rel = file_p.lstrip("/\\")
 
         # Remove extension and split into parts
-        no_ext = rel.with_suffix("")
-        parts = [part for part in no_ext.parts if part != "__init__"]
+        no_ext = os.path.splitext(rel)[0]
+        if os.altsep:
+            no_ext = no_ext.replace(os.altsep, os.sep)
+        parts = [part for part in no_ext.split(os.sep) if part and part != "." and part != "__init__"]
         dotted = ".".join(parts)
         # If file is __init__.py at the root package directory, dotted may be empty.
         # We'll handle roots separately.
         return dotted
 
     @staticmethod
-    def get_tree(path):
+    def read_source(path) -> bytes:
+        # raw bytes, decoding is left to the consumer (the C tokenizer honours PEP 263 cookies)
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                source = f.read()
-            tree = ast.parse(source, filename=path)
-        except (SyntaxError, UnicodeDecodeError):
-            return None
-        return tree
-
-    @staticmethod
-    def get_classes(groups):
-        return [Class.from_tree_node(node) for node in groups.get(ast.ClassDef, [])]
+            return os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
 
     @staticmethod
-    def get_functions(groups):
-        return [
-            Function.from_tree_node(node) for node in
-            groups.get(ast.FunctionDef, []) + groups.get(ast.AsyncFunctionDef, [])
-        ]
-
-    @staticmethod
-    def get_imports(groups):
-        imports = []
-
-        for node in groups.get(ast.Import, []):
-
-            for alias in node.names:
-                if alias.name:
-                    imports.append(alias.name)
-
-        for node in groups.get(ast.ImportFrom, []):
-            module = node.module or ""
-            if module:
-                imports.append(module)
-
-        return imports
+    def get_tree(path, source: Optional[bytes] = None):
+        try:
+            if source is None:
+                source = Module.read_source(path)
+            # empty or whitespace-only files (typically __init__.py) are valid and define nothing: skip the parser
+            if not source.strip():
+                return ast.Module(body=[], type_ignores=[])
+            # same as ast.parse minus the Python-level wrapper; dont_inherit keeps this module's
+            # __future__ flags out of the parse
+            tree = compile(source, path, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+        except (SyntaxError, ValueError, OSError):
+            return None
+        return tree
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -295,18 +393,38 @@ class Module:
             "imports": self.imports,
         }
 
-    def build_edges(self):
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Module":
+        """Rebuild a Module from the output of ``to_dict``.
+
+        Examples:
+        - Round-trip a module description
+            ```python
+
+            >>> mod = Module(name="pkg.m", path="/abs/m.py", classes=[Class("A", 1, methods=[Function("f", 2)])])
+            >>> Module.from_dict(mod.to_dict()) == mod
+            True
+
+            ```
+        """
+        return cls(
+            name=data["name"],
+            path=data["path"],
+            classes=[Class.from_dict(c) for c in data["classes"]],
+            functions=[Function.from_dict(f) for f in data["functions"]],
+            imports=list(data["imports"]),
+        )
+
+    def build_edges(self) -> List[Edge]:
+        name = self.name
         edges = []
         for class_data in self.classes:
-            edges.extend(class_data.build_edges(self.name))
+            edges.extend(class_data.build_edges(name))
 
         for func in self.functions:
-            edges.append(
-                func.build_edges(self.name)
-            )
+            edges.extend(func.build_edges(name))
         # imports edges
-        for imp in self.imports:
-            edges.append({"type": "imports", "from": self.name, "to": imp})
+        edges.extend([_new_edge(Edge, (EDGE_IMPORTS, name, imp)) for imp in self.imports])
 
         return edges
 
@@ -329,7 +447,9 @@ class Module:
         return render_module_dependency(self)
 
     @classmethod
-    def from_file(cls, file_path: str, root: str) -> Optional["Module"]:
+    def from_file(
+        cls, file_path: str, root: str, dotted_name: Optional[str] = None, source: Optional[bytes] = None
+    ) -> Optional["Module"]:
         """Parse a Python source file and extract high-level structural information.
 
         This function uses Python's ``ast`` module to find classes, top-level functions,
@@ -337,7 +457,11 @@ class Module:
 
         Args:
             file_path (str): Absolute path to a Python source file to parse.
-            dotted_name (str): Dotted module name that will be associated with the file.
+            root (str): Crawl root used to derive the dotted module name from ``file_path``.
+            dotted_name (Optional[str]): Dotted module name that will be associated with the file. When given
+                (the crawler already knows it from the directory walk), ``root`` is not used to compute it.
+            source (Optional[bytes]): Contents of ``file_path`` when the caller has already read them; the file
+                is read when omitted.
 
         Returns:
             Optional[Module]: A populated ModuleInfo on success, or ``None`` when the
@@ -361,31 +485,152 @@ class Module:
             ...         _ = fh.write("\\n")
             ...         _ = fh.write("def f():\\n")
             ...         _ = fh.write("    return 42\\n")
-            ...     mi = _parse_module(p, "mod")
+            ...     mi = Module.from_file(p, d)
             ...     (mi.name, [c.name for c in mi.classes], [f.name for f in mi.functions], mi.imports)
             ('mod', ['A'], ['f'], ['math'])
 
             ```
         """
-        dotted_name = Module.convert_path_to_dot(root, file_path)
+        if dotted_name is None:
+            dotted_name = Module.convert_path_to_dot(root, file_path)
         # If dotted is empty (root __init__.py), use the directory name as module name
         if not dotted_name:
-            base = Path(file_path).parent.name
+            base = os.path.basename(os.path.dirname(file_path))
             dotted_name = base
 
-        tree = cls.get_tree(file_path)
-        groups = get_filtered_objects(list(tree.body))
+        tree = cls.get_tree(file_path, source)
+        if tree is None:
+            return None
+        classes: List[Class] = []
+        functions: List[Function] = []
+        async_functions: List[Function] = []
+        # a dict keeps the first occurrence of each import in source order, no sort needed
+        imports: Dict[str, None] = {}
+        dispatch = _TOP_LEVEL_DISPATCH.get
+        for node in tree.body:
+            handler = dispatch(type(node))
+            if handler is not None:
+                handler(node, classes, functions, async_functions, imports)
+
+        return cls(
+            name=dotted_name,
+            path=os.path.abspath(file_path),
+            classes=classes,
+            # plain functions first, then coroutines
+            functions=functions + async_functions,
+            imports=list(imports),
+        )
+
+    @classmethod
+    def scan_file(cls, file_path: str, root: str, dotted_name: Optional[str] = None) -> Optional["Module"]:
+        """Build a Module from a line scan of the source instead of a full parse.
+
+        Module-level ``class``/``def``/``import``/``from ... import`` lines and the methods directly below
+        each class are found with a single regular-expression pass over the raw bytes, which is much faster
+        than ``ast`` on large trees. The result is best-effort: decorators are not collected, bases are
+        taken as written on the ``class`` line, and lines inside multi-line strings are not told apart from
+        code. Use ``from_file`` when exact results are needed.
+
+        Args:
+            file_path (str): Absolute path to a Python source file to scan.
+            root (str): Crawl root used to derive the dotted module name from ``file_path``.
+            dotted_name (Optional[str]): Dotted module name associated with the file, see ``from_file``.
+
+        Returns:
+            Optional[Module]: The scanned module, or ``None`` when the file cannot be read.
+
+        Examples:
+        - Scan a module with an import, a class with one method and a coroutine
+            ```python
+
+            >>> import os, tempfile
+            >>> with tempfile.TemporaryDirectory() as d:
+            ...     p = os.path.join(d, "mod.py")
+            ...     with open(p, "w", encoding="utf-8") as fh:
+            ...         _ = fh.write("from os import path\\n")
+            ...         _ = fh.write("class A(Base):\\n")
+            ...         _ = fh.write("    def m(self):\\n")
+            ...         _ = fh.write("        pass\\n")
+            ...         _ = fh.write("async def f():\\n")
+            ...         _ = fh.write("    pass\\n")
+            ...     mi = Module.scan_file(p, d)
+            ...     (mi.name, mi.classes[0].bases, [m.name for m in mi.classes[0].methods], mi.functions[0].lineno, mi.imports)
+            ('mod', ['Base'], ['m'], 5, ['os'])
+
+            ```
+        """
+        if dotted_name is None:
+            dotted_name = Module.convert_path_to_dot(root, file_path)
+        if not dotted_name:
+            dotted_name = os.path.basename(os.path.dirname(file_path))
+        try:
+            source = cls.read_source(file_path)
+        except OSError:
+            return None
+
+        classes: List[Class] = []
+        functions: List[Function] = []
+        async_functions: List[Function] = []
+        imports: Dict[str, None] = {}
+        current: Optional[Class] = None
+        method_indent = None
+        header_end = 0
+        lineno, pos = 1, 0
+        for m in _SCAN_RE.finditer(source):
+            start = m.start()
+            lineno += source.count(b"\n", pos, start)
+            pos = start
+            indent, func = m.group("indent"), m.group("func")
+            if indent:
+                # continuation lines of a multi-line class header are not part of its body
+                if current is not None and start >= header_end:
+                    # the first statement of the class body, whatever it is, sets the indent of its methods;
+                    # deeper defs (nested functions, nested classes, defs under "if") are skipped
+                    if method_indent is None:
+                        method_indent = indent
+                    if func is not None and indent == method_indent:
+                        current.methods.append(Function(name=sys.intern(func.decode("utf-8")), lineno=lineno))
+                continue
+
+            # any statement at column 0 ends the class body above, e.g. "if ...:" or an assignment
+            current = None
+            if m.group("other") is not None:
+                continue
+            if func is not None:
+                target = async_functions if m.group("is_async") else functions
+                target.append(Function(name=sys.intern(func.decode("utf-8")), lineno=lineno))
+            elif m.group("cls") is not None:
+                bases = m.group("bases")
+                current = Class(
+                    name=sys.intern(m.group("cls").decode("utf-8")),
+                    lineno=lineno,
+                    bases=_scan_bases(bases) if bases else [],
+                )
+                method_indent = None
+                if bases is None and source.startswith(b"(", m.end()):
+                    header_end = _scan_header_end(source, m.end())
+                classes.append(current)
+            elif m.group("imp") is not None:
+                for alias in m.group("imp").decode("utf-8", "replace").split(","):
+                    name = alias.split()
+                    if name and name[0] != "\\":
+                        imports[sys.intern(name[0])] = None
+            else:
+                # relative imports: "from .x import y" records "x", "from . import y" records nothing
+                module = m.group("frm").lstrip(b".")
+                if module:
+                    imports[sys.intern(module.decode("utf-8"))] = None
 
         return cls(
             name=dotted_name,
-            path=str(Path(file_path).absolute()),
-            classes=cls.get_classes(groups),
-            functions=cls.get_functions(groups),
-            imports=sorted(set(cls.get_imports(groups))),
+            path=os.path.abspath(file_path),
+            classes=classes,
+            functions=functions + async_functions,
+            imports=list(imports),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """In-memory representation of the crawled package structure.
 
@@ -421,6 +666,8 @@ class Package:
     root_path: str
     roots: List[str]  # top-level package names discovered
     modules: Dict[str, Module]  # dotted module name -> Module
+    # result of build_edges, computed on first use; the model is not expected to change after the crawl
+    _edges: Optional[List[Edge]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict:
         """Convert the model to a plain serializable dictionary.
@@ -443,10 +690,10 @@ class Package:
             "root_path": self.root_path,
             "roots": self.roots,
             "modules": {k: v.to_dict() for k, v in sorted(self.modules.items())},
-            "edges": self.build_edges(),
+            "edges": [e.to_dict() for e in self.build_edges()],
         }
 
-    def build_edges(self) -> List[Dict[str, str]]:
+    def build_edges(self, refresh: bool = False) -> List[Edge]:
         """Build relationship edges between modules, classes, functions, and imports.
 
         For each module, this function creates the following edge types:
@@ -455,8 +702,14 @@ class Package:
         - ``inherits``: from class to each base class name string.
         - ``imports``: from module to each imported module name.
 
+        The edges are computed once and the same list is returned by later calls (``to_dict`` included), so it
+        should not be modified in place.
+
+        Args:
+            refresh (bool): Recompute the edges, e.g. after ``modules`` or their contents were changed.
+
         Returns:
-            List[Dict[str, str]]: A list of edges, each with keys ``type``, ``from``, and ``to``.
+            List[Edge]: A list of ``(type, src, dst)`` edges; ``Edge.to_dict`` gives the serialized form.
 
         Raises:
             None
@@ -468,15 +721,17 @@ class Package:
             >>> mod = Module(name='pkg.m', path='X',
             ...                  classes=[Class(name='A', lineno=1, bases=['Base'], methods=[Function('x', 2)])],
             ...                  functions=[Function('f', 3)], imports=['math'])
-            >>> pm = Package(root_path='/', roots=['pkg'], modules={'pkg.m': module})
-            >>> edges = build_edges(pm)
-            >>> any(e['type']=='module_contains' and e['to']=='pkg.m.A' for e in edges)
+            >>> pm = Package(root_path='/', roots=['pkg'], modules={'pkg.m': mod})
+            >>> edges = pm.build_edges()
+            >>> any(e.type=='module_contains' and e.dst=='pkg.m.A' for e in edges)
             True
-            >>> any(e['type']=='class_contains' and e['to']=='pkg.m.A.x' for e in edges)
+            >>> any(e.type=='class_contains' and e.dst=='pkg.m.A.x' for e in edges)
             True
-            >>> any(e['type']=='inherits' and e['to']=='Base' for e in edges)
+            >>> any(e.type=='inherits' and e.dst=='Base' for e in edges)
             True
-            >>> any(e['type']=='imports' and e['to']=='math' for e in edges)
+            >>> any(e.type=='imports' and e.dst=='math' for e in edges)
+            True
+            >>> pm.build_edges() is edges
             True
 
             ```
@@ -484,13 +739,71 @@ class Package:
         See Also:
             crawl_package: Produces the PackageModel consumed here.
         """
-        edges: List[Dict[str, str]] = []
+        if self._edges is not None and not refresh:
+            return self._edges
+
+        edges: List[Edge] = []
 
         for _, module in self.modules.items():
             edges.extend(module.build_edges())
 
+        self._edges = edges
         return edges
 
+    def edges_by_type(self) -> Dict[str, List[Edge]]:
+        """Group the edges from ``build_edges`` by their type in a single pass.
+
+        Returns:
+            Dict[str, List[Edge]]: Edge type -> edges of that type, in ``build_edges`` order. Types without
+            edges map to an empty list.
+
+        Examples:
+        - Group the edges of a minimal model
+            ```python
+
+            >>> mod = Module(name='pkg.m', path='X', functions=[Function('f', 3)], imports=['math', 'os'])
+            >>> groups = Package(root_path='/', roots=['pkg'], modules={'pkg.m': mod}).edges_by_type()
+            >>> [e.dst for e in groups[EDGE_IMPORTS]]
+            ['math', 'os']
+            >>> groups[EDGE_INHERITS]
+            []
+
+            ```
+        """
+        groups: Dict[str, List[Edge]] = defaultdict(list)
+        for edge in self.build_edges():
+            groups[edge[0]].append(edge)
+        return groups
+
+    def iter_edges(self) -> Iterator[Edge]:
+        """Yield the same edges as ``build_edges`` without building the whole list.
+
+        Edges are produced one module at a time, so only the current module's edges are alive at once. The
+        cached list is used when ``build_edges`` already ran; otherwise nothing is cached.
+
+        Yields:
+            Edge: ``(type, src, dst)`` edges in ``build_edges`` order.
+
+        Examples:
+        - Stream the edges of a minimal model
+            ```python
+
+            >>> mod = Module(name='pkg.m', path='X', functions=[Function('f', 3)], imports=['math'])
+            >>> pm = Package(root_path='/', roots=['pkg'], modules={'pkg.m': mod})
+            >>> [e.dst for e in pm.iter_edges()]
+            ['pkg.m.f', 'math']
+            >>> list(pm.iter_edges()) == pm.build_edges()
+            True
+
+            ```
+        """
+        if self._edges is not None:
+            yield from self._edges
+            return
+
+        for module in self.modules.values():
+            yield from module.build_edges()
+
     def to_mermaid_class_diagram(
         self,
         include_class_relations: bool = True,
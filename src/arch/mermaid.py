@@ -1,9 +1,15 @@
 import re
+from operator import attrgetter, itemgetter
 from typing import List, Optional
 from dataclasses import dataclass
 
+_BY_NAME = attrgetter("name")
 
-@dataclass
+# characters that are not allowed in a mermaid classDef name
+_UNSAFE_STYLE_CHARS = re.compile(r"[^A-Za-z0-9_]")
+
+
+@dataclass(slots=True)
 class Style:
     name: Optional[str] = None
     fill_color: str = "#eef6ff"
@@ -13,40 +19,49 @@ class Style:
 
     @property
     def class_def(self):
-        return f"classDef {self.name} fill:{self.fill_color},stroke:{self.stroke_color},stroke-width:1px,color:{self.color};"
+        return self._class_def(self.name)
+
+    def _class_def(self, name: Optional[str]) -> str:
+        return f"classDef {name} fill:{self.fill_color},stroke:{self.stroke_color},stroke-width:1px,color:{self.color};"
 
-    def apply_style(self, class_names: List[str]) -> List[str]:
-        lines = []
-        style_name = re.sub(r"[^A-Za-z0-9_]", "_", f"{self.name}_style")
+    def apply_style(self, class_names: List[str], name: Optional[str] = None) -> List[str]:
+        # ``name`` overrides the style's own name for this call only; the Style itself is never modified,
+        # so one instance can be shared between modules (and is, as the default of Module.to_mermaid_class_diagram)
+        if name is None:
+            name = self.name
+        style_name = _UNSAFE_STYLE_CHARS.sub("_", f"{name}_style")
         # Define a pleasant, distinct style for module classes
         # Apply style per-class using official classDiagram 'class' directive
-        for cname in class_names:
-            lines.append(f"class {cname}:::{style_name}")
+        lines = [f"class {cname}:::{style_name}" for cname in class_names]
 
-        lines.append(self.class_def)
+        lines.append(self._class_def(name))
         # Attach a label to the first class to indicate module ownership
         first_cls = class_names[0]
-        lines.append(f"note for {first_cls} \"module: {self.name}\"")
+        lines.append(f"note for {first_cls} \"module: {name}\"")
 
         return lines
 
 
 # Mermaid rendering helpers extracted from data models to improve separation of concerns
 # We keep functions simple and side-effect free; they accept plain data model instances.
+# Each render_* function validates its arguments and starts the diagram; the _emit_* helpers append the
+# body lines to a shared list, so nested diagrams are never joined into a string and split again.
 
-def render_function_diagram(func, detail_level: str = "all", include_decorators: bool = False) -> str:
-    allowed_levels = {"all", "public", "none"}
-    if detail_level not in allowed_levels:
+_DETAIL_LEVELS = frozenset({"all", "public", "none"})
+
+
+def _check_detail_level(value: str, arg: str = "detail_level") -> None:
+    if value not in _DETAIL_LEVELS:
         raise ValueError(
-            f"Unsupported detail_level '{detail_level}'. Expected one of {sorted(allowed_levels)}"
+            f"Unsupported {arg} '{value}'. Expected one of {sorted(_DETAIL_LEVELS)}"
         )
 
-    lines: List[str] = ["classDiagram"]
 
+def _emit_function(lines: List[str], func, detail_level: str, include_decorators: bool) -> None:
     if detail_level == "none":
-        return "\n".join(lines)
+        return
     if detail_level == "public" and getattr(func, "name", "").startswith("_"):
-        return "\n".join(lines)
+        return
 
     s = "{\n    }"
     lines.append(f"    class {func.name} {s}")
@@ -57,133 +72,118 @@ def render_function_diagram(func, detail_level: str = "all", include_decorators:
         )
         lines.append(f"note for {func.name} \"decorators: {decos}\"")
 
-    return "\n".join(lines)
-
-
-def render_class_diagram(cls, include_relations: bool = True, detail_level: str = "all") -> str:
-    allowed_levels = {"all", "public", "none"}
-    if detail_level not in allowed_levels:
-        raise ValueError(
-            f"Unsupported detail_level '{detail_level}'. Expected one of {sorted(allowed_levels)}"
-        )
-
-    lines: List[str] = ["classDiagram"]
-
-    lines.append(f"class {cls.name} {{")
 
+def _emit_class(
+    lines: List[str], cls, include_relations: bool, detail_level: str, relations: Optional[List[str]] = None
+) -> None:
+    # inheritance lines follow the class block, or go to ``relations`` when the caller places them later
     if detail_level == "all":
-        selected_methods = getattr(cls, "methods", [])
+        selected_methods = getattr(cls, "methods", ())
     elif detail_level == "public":
-        selected_methods = [m for m in getattr(cls, "methods", []) if not m.name.startswith("_")]
+        selected_methods = [m for m in getattr(cls, "methods", ()) if not m.name.startswith("_")]
     else:
         selected_methods = []
 
-    for m in sorted(selected_methods, key=lambda mm: mm.name):
-        lines.append(f"  +{m.name}()")
-    lines.append("}")
+    # the whole class block is one entry: a single join for the members instead of an append per line
+    members = "".join([f"\n  +{m.name}()" for m in sorted(selected_methods, key=_BY_NAME)])
+    lines.append(f"class {cls.name} {{{members}\n}}")
 
     if include_relations:
-        for base in sorted(getattr(cls, "bases", [])):
-            lines.append(f"{base} <|-- {cls.name}")
-
-    return "\n".join(lines)
-
-
-def render_module_diagram(module, include_relations: bool = True, class_detail_level: str = "all", function_detail_level: str = "all", include_decorators: bool = True, style: Optional[Style] = None) -> str:
-    allowed_levels = {"all", "public", "none"}
-    if class_detail_level not in allowed_levels:
-        raise ValueError(
-            f"Unsupported class_detail_level '{class_detail_level}'. Expected one of {sorted(allowed_levels)}"
-        )
-    if function_detail_level not in allowed_levels:
-        raise ValueError(
-            f"Unsupported function_detail_level '{function_detail_level}'. Expected one of {sorted(allowed_levels)}"
+        (lines if relations is None else relations).extend(
+            [f"{base} <|-- {cls.name}" for base in sorted(getattr(cls, "bases", ()))]
         )
 
-    lines: List[str] = ["classDiagram"]
 
-    # Render classes
-    for cls in sorted(getattr(module, "classes", []), key=lambda c: c.name):
-        parts = render_class_diagram(cls, include_relations=False, detail_level=class_detail_level).splitlines()
-        if parts and parts[0].strip().lower() == "classdiagram":
-            parts = parts[1:]
-        lines.extend(parts)
+def _emit_module(
+    lines: List[str], module, include_relations: bool, class_detail_level: str, function_detail_level: str,
+    include_decorators: bool, style: Optional[Style],
+) -> None:
+    classes = sorted(getattr(module, "classes", ()), key=_BY_NAME)
+    # Render classes, collecting their inheritance relations in the same pass
+    relations: List[str] = []
+    for cls in classes:
+        _emit_class(lines, cls, include_relations, class_detail_level, relations)
 
-    # Render inheritance relations
-    if include_relations:
-        for cls in sorted(getattr(module, "classes", []), key=lambda c: c.name):
-            for base in sorted(getattr(cls, "bases", [])):
-                lines.append(f"{base} <|-- {cls.name}")
+    # Render inheritance relations after all class blocks
+    lines.extend(relations)
 
     # Render top-level functions
     if function_detail_level != "none":
         if function_detail_level == "all":
-            funcs = getattr(module, "functions", [])
+            funcs = getattr(module, "functions", ())
         else:
-            funcs = [f for f in getattr(module, "functions", []) if not f.name.startswith("_")]
-        for f in sorted(funcs, key=lambda ff: ff.name):
-            parts = render_function_diagram(f, detail_level=function_detail_level, include_decorators=include_decorators).splitlines()
-            if parts and parts[0].strip().lower() == "classdiagram":
-                parts = parts[1:]
-            lines.extend(parts)
+            funcs = [f for f in getattr(module, "functions", ()) if not f.name.startswith("_")]
+        for f in sorted(funcs, key=_BY_NAME):
+            _emit_function(lines, f, detail_level=function_detail_level, include_decorators=include_decorators)
 
     # Apply style if requested
-    if style and getattr(module, "classes", None):
-        class_names = sorted([c.name for c in module.classes])
-        style.name = getattr(module, "name", style.name)
-        lines.extend(style.apply_style(class_names))
+    if style and classes:
+        class_names = [c.name for c in classes]
+        lines.extend(style.apply_style(class_names, getattr(module, "name", None)))
+
+
+def render_function_diagram(func, detail_level: str = "all", include_decorators: bool = False) -> str:
+    _check_detail_level(detail_level)
+    lines: List[str] = ["classDiagram"]
+    _emit_function(lines, func, detail_level, include_decorators)
+    return "\n".join(lines)
+
+
+def render_class_diagram(cls, include_relations: bool = True, detail_level: str = "all") -> str:
+    _check_detail_level(detail_level)
+    lines: List[str] = ["classDiagram"]
+    _emit_class(lines, cls, include_relations, detail_level)
+    return "\n".join(lines)
+
 
+def render_module_diagram(module, include_relations: bool = True, class_detail_level: str = "all", function_detail_level: str = "all", include_decorators: bool = True, style: Optional[Style] = None) -> str:
+    _check_detail_level(class_detail_level, "class_detail_level")
+    _check_detail_level(function_detail_level, "function_detail_level")
+    lines: List[str] = ["classDiagram"]
+    _emit_module(
+        lines, module, include_relations, class_detail_level, function_detail_level, include_decorators, style
+    )
     return "\n".join(lines)
 
 
 def render_module_dependency(module) -> str:
     lines: List[str] = ["classDiagram"]
-    added_imports = set()
-    for imp in getattr(module, "imports", []):
-        edge = (getattr(module, "name", ""), imp)
-        if edge not in added_imports:
-            lines.append(f"{module.name} ..> {imp} : imports")
-            added_imports.add(edge)
+    # the source is the same for every edge, so deduplicating the targets (in first-seen order) is enough
+    name = getattr(module, "name", "")
+    lines.extend([f"{name} ..> {imp} : imports" for imp in dict.fromkeys(getattr(module, "imports", ()))])
     return "\n".join(lines)
 
 
 def render_package_diagram(package, include_class_relations: bool = True, class_detail_level: str = "all", function_detail_level: str = "all", include_decorators: bool = True, include_module_styling: bool = True) -> str:
-    allowed_levels = {"all", "public", "none"}
-    if class_detail_level not in allowed_levels:
-        raise ValueError(
-            f"Unsupported class_detail_level '{class_detail_level}'. Expected one of {sorted(allowed_levels)}"
-        )
-    if function_detail_level not in allowed_levels:
-        raise ValueError(
-            f"Unsupported function_detail_level '{function_detail_level}'. Expected one of {sorted(allowed_levels)}"
-        )
+    _check_detail_level(class_detail_level, "class_detail_level")
+    _check_detail_level(function_detail_level, "function_detail_level")
 
     lines: List[str] = ["classDiagram"]
+    # sorted once, shared by the module pass and the relation pass
+    modules = [module for _, module in sorted(getattr(package, "modules", {}).items(), key=itemgetter(0))]
 
     # Render each module
-    for _, module in sorted(getattr(package, "modules", {}).items(), key=lambda kv: kv[0]):
+    for module in modules:
         style = Style(name=module.name) if include_module_styling else None
-        parts = render_module_diagram(
+        _emit_module(
+            lines,
             module,
             include_relations=False,
             class_detail_level=class_detail_level,
             function_detail_level=function_detail_level,
             include_decorators=include_decorators,
             style=style,
-        ).splitlines()
-        if parts and parts[0].strip().lower() == "classdiagram":
-            parts = parts[1:]
-        lines.extend(parts)
+        )
 
     # Aggregate inheritance relations across all classes
     if include_class_relations:
-        added_rel = set()
-        for _, module in sorted(getattr(package, "modules", {}).items(), key=lambda kv: kv[0]):
-            for cls in getattr(module, "classes", []):
-                for base in getattr(cls, "bases", []):
-                    rel = (base, cls.name)
-                    if rel not in added_rel:
-                        lines.append(f"{base} <|-- {cls.name}")
-                        added_rel.add(rel)
+        # dict.fromkeys drops repeated (base, class) pairs in C while keeping the first-seen order
+        relations = dict.fromkeys(
+            (base, cls.name)
+            for module in modules
+            for cls in getattr(module, "classes", ())
+            for base in getattr(cls, "bases", ())
+        )
+        lines.extend([f"{base} <|-- {cname}" for base, cname in relations])
 
     return "\n".join(lines)
@@ -33,17 +33,28 @@ def _extract_name(node: ast.AST) -> str:
 
         ```
     """
-    # Convert ast nodes representing names/attributes to a string
-    if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        return f"{_extract_name(node.value)}.{node.attr}"
-    if isinstance(node, ast.Subscript):
-        return _extract_name(node.value)
-    if isinstance(node, ast.Call):
-        return _extract_name(node.func)
-    if isinstance(node, ast.Constant):
-        return str(node.value)
-    if isinstance(node, ast.Tuple):
-        return ", ".join(_extract_name(elt) for elt in node.elts)
-    return getattr(node, "id", repr(node))
\ No newline at end of file
+    handler = _EXTRACT.get(type(node))
+    if handler is None:
+        return getattr(node, "id", repr(node))
+    return handler(node)
+
+
+def _extract_attribute(node: ast.Attribute) -> str:
+    # walk the attribute chain iteratively instead of recursing once per dot
+    parts = []
+    while type(node) is ast.Attribute:
+        parts.append(node.attr)
+        node = node.value
+    parts.append(_extract_name(node))
+    return ".".join(reversed(parts))
+
+
+# AST node classes are leaves, so an exact ``type(node)`` lookup replaces the isinstance chain.
+_EXTRACT = {
+    ast.Name: lambda n: n.id,
+    ast.Attribute: _extract_attribute,
+    ast.Subscript: lambda n: _extract_name(n.value),
+    ast.Call: lambda n: _extract_name(n.func),
+    ast.Constant: lambda n: str(n.value),
+    ast.Tuple: lambda n: ", ".join(map(_extract_name, n.elts)),
+}
@@ -1,56 +1,78 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
+from arch.data_models import Package
 
 
-def _insert_into_tree(tree: Dict[str, dict], path_parts: List[str], mod: Dict) -> None:
-    """Insert a module dict into the tree at the given path parts.
+def _insert_into_tree(nodes: Dict[Optional[str], dict], name: str, mod: Dict) -> None:
+    """Insert a module dict into the tree under its dotted name.
 
-    Mirrors the logic of the previous nested `insert` function inside render_tree.
+    ``nodes`` maps every dotted prefix created so far to its tree node, with the tree itself under ``None``.
+    Only the levels below the deepest existing ancestor are walked and created, so sibling modules do not
+    re-descend from the root.
     """
-    cur = tree
-    for i, part in enumerate(path_parts):
+    missing: List[str] = []
+    prefix: Optional[str] = name
+    while prefix not in nodes:
+        parent, dot, part = prefix.rpartition(".")
+        missing.append(part)
+        prefix = parent if dot else None
+    cur = nodes[prefix]
+    for part in reversed(missing):
         cur = cur.setdefault(part, {})
-        if i == len(path_parts) - 1:
-            cur.setdefault("__module__", mod)
+        prefix = part if prefix is None else f"{prefix}.{part}"
+        nodes[prefix] = cur
+    cur.setdefault("__module__", mod)
 
 
 def _draw_tree(node: Dict, lines: List[str], prefix: str = "") -> None:
     """Populate `lines` with the ASCII representation for `node`.
 
-    Mirrors the logic of the previous nested `draw` function inside render_tree.
+    The tree is walked depth-first with an explicit stack instead of recursion, so deep package trees cost
+    no Python frames per level and cannot hit the recursion limit. Each stack item carries the header line
+    of the child it draws, which keeps the output in the same pre-order as the recursive version.
     """
-    # list entries except the special __module__ key
-    keys = [k for k in node.keys() if k != "__module__"]
-    keys.sort()
-    mod = node.get("__module__")
-    if mod:
-        # print classes and functions under this module
-        for c in mod.get("classes", []):
-            lines.append(
-                f"{prefix}├─ class {c['name']} (bases: {', '.join(c.get('bases', [])) or 'object'})"
-            )
-            methods = c.get("methods", [])
-            for j, m in enumerate(methods):
-                is_last_method = j == len(methods) - 1 and not keys
-                branch = "└" if is_last_method else "├"
-                lines.append(f"{prefix}│  {branch}─ def {m['name']}()")
-        funcs = mod.get("functions", [])
-        for i, f in enumerate(funcs):
-            is_last_func = i == len(funcs) - 1 and not keys
-            branch = "└" if is_last_func else "├"
-            lines.append(f"{prefix}{branch}─ def {f['name']}()")
-
-    for i, k in enumerate(keys):
-        is_last = i == len(keys) - 1
-        branch = "└" if is_last else "├"
-        lines.append(f"{prefix}{branch}─ {k}")
-        _draw_tree(node[k], lines, prefix + ("   " if is_last else "│  "))
-
-
-def render_tree(model_dict: Dict) -> str:
+    stack = [(node, prefix, None)]
+    while stack:
+        node, prefix, header = stack.pop()
+        if header is not None:
+            lines.append(header)
+        # list entries except the special __module__ key
+        keys = [k for k in node.keys() if k != "__module__"]
+        keys.sort()
+        mod = node.get("__module__")
+        # connector prefixes for this level, built once per node instead of once per line
+        tee, elbow = prefix + "├─ ", prefix + "└─ "
+        if mod:
+            # print classes and functions under this module
+            block: List[str] = []
+            method_tee = prefix + "│  ├─ def "
+            # the last method/function of a leaf module closes its level; nothing else depends on the position
+            last_method_tee = method_tee if keys else prefix + "│  └─ def "
+            for c in mod.get("classes", []):
+                block.append(f"{tee}class {c['name']} (bases: {', '.join(c.get('bases', [])) or 'object'})")
+                methods = c.get("methods", [])
+                if methods:
+                    block.extend([f"{method_tee}{m['name']}()" for m in methods[:-1]])
+                    block.append(f"{last_method_tee}{methods[-1]['name']}()")
+            funcs = mod.get("functions", [])
+            if funcs:
+                block.extend([f"{tee}def {f['name']}()" for f in funcs[:-1]])
+                block.append(f"{tee if keys else elbow}def {funcs[-1]['name']}()")
+            lines.extend(block)
+
+        # push children last-to-first so they are popped in sorted order
+        last = len(keys) - 1
+        if last >= 0:
+            stack.append((node[keys[last]], prefix + "   ", elbow + keys[last]))
+            child_prefix = prefix + "│  "
+            for i in range(last - 1, -1, -1):
+                stack.append((node[keys[i]], child_prefix, tee + keys[i]))
+
+
+def render_tree(model_dict: Union[Package, Dict]) -> str:
     """Render a human-readable ASCII tree of the package hierarchy.
 
     Args:
-        model_dict (Dict): A model as produced by ``crawl_package`` or ``Package.to_dict``.
+        model_dict (Union[Package, Dict]): A model as produced by ``crawl_package`` or ``Package.to_dict``.
 
     Returns:
         str: A string with an ASCII tree, prefixed by a header listing package roots.
@@ -86,17 +108,24 @@ def render_tree(model_dict: Dict) -> str:
         crawl_package: Produces a compatible model dictionary.
         to_json: For serializing the model to JSON.
     """
-    modules: Dict[str, Dict] = model_dict.get("modules", {})
+    if isinstance(model_dict, Package):
+        # only the module descriptions are drawn, so skip the edges that Package.to_dict would build
+        modules: Dict[str, Dict] = {name: mod.to_dict() for name, mod in model_dict.modules.items()}
+        roots: List[str] = model_dict.roots
+    else:
+        modules = model_dict.get("modules", {})
+        roots = model_dict.get("roots", [])
 
     # Build nested dict tree structure based on dotted module names
     tree: Dict[str, dict] = {}
+    nodes: Dict[Optional[str], dict] = {None: tree}
 
     for name, mod in modules.items():
-        parts = name.split(".") if name else ["<root>"]
-        _insert_into_tree(tree, parts, mod)
-
-    lines: List[str] = []
+        _insert_into_tree(nodes, name or "<root>", mod)
 
+    lines: List[str] = [f"Package roots: {', '.join(roots)}"]
     _draw_tree(tree, lines)
-    header = f"Package roots: {', '.join(model_dict.get('roots', []))}\n"
-    return header + "\n".join(lines)
+    if len(lines) == 1:
+        # keep the header's trailing newline for an empty tree
+        return lines[0] + "\n"
+    return "\n".join(lines)
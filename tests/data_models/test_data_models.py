@@ -96,3 +96,84 @@ class TestModuleInfoInit:
         file_path = "tests/data/test-package-1/core.py"
         mod = Module(name="pkg.core", path=str(file_path))
         assert mod.path == "tests/data/test-package-1/core.py"
+
+
+class TestModuleFromFile:
+    def test_single_pass_collects_top_level_definitions(self, tmp_path):
+        """Inputs: A module mixing classes, sync/async functions, imports and other statements.
+        Expected: from_file records the top-level class with its base and method, the plain function
+        before the coroutine, and the top-level imports in source order.
+        Checks: The type-keyed dispatch in from_file keeps that ordering and ignores statements it
+        has no handler for (the nested import under ``if`` included).
+        """
+        src = tmp_path / "mixed.py"
+        src.write_text(
+            "import os, sys\n"
+            "async def a():\n    pass\n"
+            "X = 1\n"
+            "class C(Base):\n    def m(self):\n        pass\n"
+            "from collections import abc\n"
+            "def f():\n    pass\n"
+            "if X:\n    import json\n",
+            encoding="utf-8",
+        )
+        mod = Module.from_file(str(src), str(tmp_path))
+
+        assert mod.classes == [Class(name="C", lineno=5, bases=["Base"], methods=[Function(name="m", lineno=6)])]
+        assert mod.functions == [Function(name="f", lineno=9), Function(name="a", lineno=2)]
+        assert mod.imports == ["os", "sys", "collections"]  # first occurrence, in source order
+
+
+class TestSlots:
+    def test_instances_have_no_dict_and_pickle(self):
+        """Inputs: A Module holding a Class with a method and a top-level Function.
+        Expected: None of the instances carries a per-instance ``__dict__``, and the module survives a
+        pickle round-trip (needed to return parse results from worker processes).
+        Checks: ``slots=True`` on the per-file dataclasses.
+        """
+        import pickle
+
+        func = Function(name="f", lineno=1, decorators=["d"])
+        klass = Class(name="A", lineno=2, bases=["Base"], methods=[Function(name="m", lineno=3)])
+        mod = Module(name="pkg.m", path="/x/pkg/m.py", classes=[klass], functions=[func], imports=["os"])
+
+        for obj in (func, klass, mod):
+            assert not hasattr(obj, "__dict__")
+        assert pickle.loads(pickle.dumps(mod)) == mod
+
+
+class TestToDictMatchesFields:
+    def test_to_dict_equals_asdict(self):
+        """Inputs: A Module holding a Class (bases, a decorated method) and a top-level Function.
+        Expected: The hand-written to_dict methods give exactly ``dataclasses.asdict`` of each object.
+        Checks: to_dict stays in sync with the dataclass fields when a field is added or renamed
+        (asdict itself is not used because it is far slower on large models).
+        """
+        from dataclasses import asdict
+
+        meth = Function(name="m", lineno=3, decorators=["property"])
+        klass = Class(name="A", lineno=2, bases=["Base"], methods=[meth])
+        func = Function(name="f", lineno=5)
+        mod = Module(name="pkg.m", path="/x/pkg/m.py", classes=[klass], functions=[func], imports=["os"])
+
+        assert func.to_dict() == asdict(func)
+        assert klass.to_dict() == asdict(klass)
+        assert mod.to_dict() == asdict(mod)
+
+
+class TestBuildEdges:
+    def test_function_and_class_both_return_lists(self):
+        """Inputs: A top-level Function and a Class with one method, built for module "pkg.m".
+        Expected: Both build_edges methods return lists, and Module.build_edges is their concatenation
+        followed by the import edges.
+        Checks: The uniform list-returning build_edges API.
+        """
+        func = Function(name="f", lineno=5)
+        klass = Class(name="A", lineno=2, methods=[Function(name="m", lineno=3)])
+        mod = Module(name="pkg.m", path="/x/pkg/m.py", classes=[klass], functions=[func], imports=["os"])
+
+        assert func.build_edges("pkg.m") == [("module_contains", "pkg.m", "pkg.m.f")]
+        assert isinstance(klass.build_edges("pkg.m"), list)
+        assert mod.build_edges() == (
+            klass.build_edges("pkg.m") + func.build_edges("pkg.m") + [("imports", "pkg.m", "os")]
+        )
@@ -113,7 +113,8 @@ class TestPackageModel_build_edges:
         """Inputs: Construct a Package with modules containing classes (with methods and multiple bases),
         functions, and imports, including a module that only has imports.
         Expected: build_edges returns edges of types module_contains (for classes and functions),
-        class_contains (for each method), inherits (for each base), and imports (for each import).
+        class_contains (for each method), inherits (for each base), and imports (for each import);
+        edges_by_type groups all of them by type.
         Checks: Count of edges per category and presence of specific representative edges.
         """
         concrete = Class(
@@ -146,13 +147,14 @@ class TestPackageModel_build_edges:
         modules = {m.name: m for m in [mod_core, mod_utils, mod_only]}
         pm = Package(root_path="/abs", roots=["pkg"], modules=modules)
 
-        edges = pm.build_edges()
+        groups = pm.edges_by_type()
+        assert sum(map(len, groups.values())) == len(pm.build_edges())
 
         # categorize
-        mc = [e for e in edges if e["type"] == "module_contains"]
-        cc = [e for e in edges if e["type"] == "class_contains"]
-        inh = [e for e in edges if e["type"] == "inherits"]
-        imps = [e for e in edges if e["type"] == "imports"]
+        mc = groups["module_contains"]
+        cc = groups["class_contains"]
+        inh = groups["inherits"]
+        imps = groups["imports"]
 
         # Counts
         assert len(mc) == 1 + 2 + 1  # 1 class in core + 2 funcs in core + 1 func in utils
@@ -161,10 +163,10 @@ class TestPackageModel_build_edges:
         assert len(imps) == 2 + 0 + 3  # core has 2, utils 0, only_imports 3
 
         # Specific edges
-        assert {e["to"] for e in mc} >= {"pkg.core.Concrete", "pkg.core.greet", "pkg.core.add", "pkg.utils.parse"}
-        assert {e["to"] for e in cc} == {"pkg.core.Concrete.area", "pkg.core.Concrete.default"}
-        assert {e["to"] for e in inh} == {"PrintableMixin", "Base"}
-        assert {e["to"] for e in imps} >= {"os", "sys", "math", "typing"}
+        assert {e.dst for e in mc} >= {"pkg.core.Concrete", "pkg.core.greet", "pkg.core.add", "pkg.utils.parse"}
+        assert {e.dst for e in cc} == {"pkg.core.Concrete.area", "pkg.core.Concrete.default"}
+        assert {e.dst for e in inh} == {"PrintableMixin", "Base"}
+        assert {e.dst for e in imps} >= {"os", "sys", "math", "typing"}
 
     def test_edges_when_no_classes_or_functions_but_imports_exist(self):
         """Inputs: Package with a single module that has only imports but no classes or functions.
@@ -174,5 +176,21 @@ class TestPackageModel_build_edges:
         mod = Module(name="pkg.only", path="/abs/only.py", imports=["os", "sys"])  # no classes/functions
         pm = Package(root_path="/", roots=["pkg"], modules={"pkg.only": mod})
         edges = pm.build_edges()
-        assert all(e["type"] == "imports" for e in edges)
-        assert {e["to"] for e in edges} == {"os", "sys"}
+        assert all(e.type == "imports" for e in edges)
+        assert {e.dst for e in edges} == {"os", "sys"}
+
+    def test_edges_are_cached_until_refreshed(self):
+        """Inputs: Package whose edges are built, then a module is added to it.
+        Expected: Repeated build_edges/to_dict calls reuse the first result; refresh=True picks up the change.
+        Checks: Identity of the cached list and the edge count before and after the refresh.
+        """
+        mod = Module(name="pkg.a", path="/abs/a.py", imports=["os"])
+        pm = Package(root_path="/", roots=["pkg"], modules={"pkg.a": mod})
+        edges = pm.build_edges()
+        assert pm.build_edges() is edges
+        assert len(pm.to_dict()["edges"]) == 1
+
+        pm.modules["pkg.b"] = Module(name="pkg.b", path="/abs/b.py", imports=["sys"])
+        assert len(pm.build_edges()) == 1
+        assert {e.dst for e in pm.build_edges(refresh=True)} == {"os", "sys"}
+        assert pm == Package(root_path="/", roots=["pkg"], modules=pm.modules)  # cache ignored by ==
@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import arch.cli as cli
+
+
+DATA = Path(__file__).parent / "data" / "relations"
+
+
+class TestMainCacheOptions:
+    def test_cache_default_before_the_path(self, tmp_path: Path, monkeypatch, capsys):
+        """
+        --cache-default takes no value, so a path after it is still read as the positional argument
+        """
+        cache_path = tmp_path / "parse_cache.json"
+        monkeypatch.setattr(cli, "DEFAULT_CACHE_PATH", str(cache_path))
+
+        assert cli.main(["--cache-default", str(DATA), "--format", "json"]) == 0
+        assert "base" in json.loads(capsys.readouterr().out)["modules"]
+        assert cache_path.is_file()
+
+    def test_cache_with_explicit_file(self, tmp_path: Path):
+        """
+        --cache PATH stores the parse cache in PATH, before or after the positional argument
+        """
+        first = tmp_path / "first.json"
+        second = tmp_path / "second.json"
+
+        assert cli.main(["--cache", str(first), str(DATA)]) == 0
+        assert cli.main([str(DATA), "--cache", str(second)]) == 0
+        assert first.is_file() and second.is_file()
+
+    def test_cache_requires_a_value(self):
+        """
+        --cache without a value is a usage error instead of silently swallowing the next argument
+        """
+        with pytest.raises(SystemExit):
+            cli.main([str(DATA), "--cache"])
+        with pytest.raises(SystemExit):
+            cli.main(["--cache", "--cache-default", str(DATA)])
@@ -1,7 +1,13 @@
+import io
+import json
+import os
 import tempfile
 from pathlib import Path
 
+import pytest
 
+
+from arch.crawler import PARALLEL_MIN_FILES, _ParseCache, _discover_roots, _iter_python_files, crawl_package, to_json, write_json  # noqa: E402
 from arch.data_models import Module  # noqa: E402
 
 
@@ -14,9 +20,9 @@ class TestModuleNameFromPath:
             parent = Path(d)
             pkg = parent / "pkg"
             pkg.mkdir()
-            (pkg / "__init__.py").write_text("", encoding="utf-8")
+            (pkg / "__init__.py").touch()
             mod = pkg / "mod.py"
-            mod.write_text("", encoding="utf-8")
+            mod.touch()
 
             dotted = Module.convert_path_to_dot(str(parent), str(mod))
             assert dotted == "pkg.mod"
@@ -30,7 +36,7 @@ class TestModuleNameFromPath:
             pkg = parent / "pkg"
             pkg.mkdir()
             init = pkg / "__init__.py"
-            init.write_text("", encoding="utf-8")
+            init.touch()
 
             dotted = Module.convert_path_to_dot(str(parent), str(init))
             assert dotted == "pkg"
@@ -44,10 +50,10 @@ class TestModuleNameFromPath:
             pkg = parent / "pkg"
             sub = pkg / "sub"
             sub.mkdir(parents=True)
-            (pkg / "__init__.py").write_text("", encoding="utf-8")
-            (sub / "__init__.py").write_text("", encoding="utf-8")
+            (pkg / "__init__.py").touch()
+            (sub / "__init__.py").touch()
             mod2 = sub / "mod2.py"
-            mod2.write_text("", encoding="utf-8")
+            mod2.touch()
 
             dotted = Module.convert_path_to_dot(str(parent), str(mod2))
             assert dotted == "pkg.sub.mod2"
@@ -60,7 +66,7 @@ class TestModuleNameFromPath:
             pkg = Path(d) / "pkg"
             pkg.mkdir()
             init = pkg / "__init__.py"
-            init.write_text("", encoding="utf-8")
+            init.touch()
 
             dotted = Module.convert_path_to_dot(str(pkg), str(init))
             assert dotted == ""
@@ -72,9 +78,9 @@ class TestModuleNameFromPath:
         with tempfile.TemporaryDirectory() as d:
             pkg = Path(d) / "pkg"
             pkg.mkdir()
-            (pkg / "__init__.py").write_text("", encoding="utf-8")
+            (pkg / "__init__.py").touch()
             mod = pkg / "mod.py"
-            mod.write_text("", encoding="utf-8")
+            mod.touch()
 
             dotted = Module.convert_path_to_dot(str(pkg), str(mod))
             assert dotted == "mod"
@@ -89,9 +95,9 @@ class TestModuleNameFromPath:
 
             pkg = other / "pkg"
             pkg.mkdir()
-            (pkg / "__init__.py").write_text("", encoding="utf-8")
+            (pkg / "__init__.py").touch()
             mod = pkg / "mod.py"
-            mod.write_text("", encoding="utf-8")
+            mod.touch()
 
             dotted = Module.convert_path_to_dot(str(root), str(mod))
             assert dotted.endswith("pkg.mod"), f"unexpected dotted name: {dotted}"
@@ -107,9 +113,392 @@ class TestModuleNameFromPath:
 
             pkg = other / "pkg"
             pkg.mkdir()
-            (pkg / "__init__.py").write_text("", encoding="utf-8")
+            (pkg / "__init__.py").touch()
             mod = pkg / "mod.py"
-            mod.write_text("", encoding="utf-8")
+            mod.touch()
 
             dotted = Module.convert_path_to_dot(root, str(mod))
             assert dotted.endswith("pkg.mod"), f"unexpected dotted name: {dotted}"
+
+
+class TestIterPythonFiles:
+    def test_ignored_dirs_are_pruned(self, tmp_path: Path):
+        """
+        files under IGNORED_DIRS (e.g. __pycache__, .venv) are never yielded
+        """
+        (tmp_path / "a.py").touch()
+        for ignored in ("__pycache__", ".venv"):
+            (tmp_path / ignored).mkdir()
+            (tmp_path / ignored / "hidden.py").touch()
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "b.py").touch()
+        (sub / "notes.txt").touch()
+        (sub / ".hidden.py").touch()
+
+        found = sorted((entry.path, dotted) for entry, dotted in _iter_python_files(str(tmp_path)))
+        assert found == [(str(tmp_path / "a.py"), "a"), (str(sub / "b.py"), "sub.b")]
+
+    def test_dotted_names_match_convert_path_to_dot(self):
+        """
+        names built during the walk agree with Module.convert_path_to_dot for every file of the test data
+        """
+        root = str(Path(__file__).parent / "data")
+        for entry, dotted in _iter_python_files(root):
+            assert dotted == Module.convert_path_to_dot(root, entry.path)
+
+    def test_collected_packages_give_the_same_roots(self):
+        """
+        roots derived from the packages recorded during the walk match a fresh listing of the root
+        """
+        for root in (Path(__file__).parent / "data", Path(__file__).parent / "data" / "relations"):
+            packages = []
+            for _ in _iter_python_files(str(root), packages):
+                pass
+            assert sorted(_discover_roots(str(root), packages)) == sorted(_discover_roots(str(root)))
+
+    def test_unparsable_file_is_skipped_by_crawl(self, tmp_path: Path):
+        """
+        a module with a syntax error is skipped instead of aborting the crawl
+        """
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").touch()
+        (pkg / "good.py").write_text("class A:\n    pass\n", encoding="utf-8")
+        (pkg / "bad.py").write_text("def broken(:\n", encoding="utf-8")
+
+        model = crawl_package(str(tmp_path))
+        assert "pkg.good" in model.modules
+        assert "pkg.bad" not in model.modules
+
+
+class TestCrawlPackageWorkers:
+    def test_parallel_crawl_matches_serial(self, tmp_path: Path):
+        """
+        a tree above PARALLEL_MIN_FILES crawled with a process pool gives the same modules as a serial crawl
+        """
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").touch()
+        for i in range(PARALLEL_MIN_FILES + 4):
+            (pkg / f"m{i}.py").write_text(f"import os\n\nclass C{i}:\n    def run(self):\n        pass\n", encoding="utf-8")
+
+        serial = crawl_package(str(tmp_path), workers=1)
+        parallel = crawl_package(str(tmp_path), workers=2)
+        assert serial.modules.keys() == parallel.modules.keys()
+        assert serial.to_dict()["modules"] == parallel.to_dict()["modules"]
+
+    def test_default_parses_serially_without_a_process_pool(self, tmp_path: Path, monkeypatch):
+        """
+        without an explicit workers value no process pool is started, even above PARALLEL_MIN_FILES
+        """
+        import arch.crawler as crawler
+
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").touch()
+        for i in range(PARALLEL_MIN_FILES + 4):
+            (pkg / f"m{i}.py").write_text(f"class C{i}:\n    pass\n", encoding="utf-8")
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("a process pool was started")
+
+        monkeypatch.setattr(crawler, "ProcessPoolExecutor", no_pool)
+        model = crawl_package(str(tmp_path))
+        assert len(model.modules) == PARALLEL_MIN_FILES + 5
+
+    def test_modules_are_inserted_in_name_order(self):
+        """
+        crawl_package fills the modules dict sorted by dotted name, whatever the walk order was
+        """
+        model = crawl_package(str(Path(__file__).parent / "data"), workers=1)
+        assert list(model.modules) == sorted(model.modules)
+
+
+class TestToJson:
+    def test_package_encodes_like_to_dict(self):
+        """
+        to_json(Package) produces exactly the JSON of Package.to_dict()
+        """
+        model = crawl_package(str(Path(__file__).parent / "data" / "relations"), workers=1)
+        assert to_json(model, indent=2) == json.dumps(model.to_dict(), indent=2)
+
+    def test_write_json_streams_the_same_document(self):
+        """
+        write_json streams a document that parses back to Package.to_dict()
+        """
+        model = crawl_package(str(Path(__file__).parent / "data"), workers=1)
+        buf = io.BytesIO()
+        write_json(model, buf)
+        assert json.loads(buf.getvalue()) == model.to_dict()
+
+    def test_write_json_batches_edges_without_caching_them(self, monkeypatch):
+        """
+        edges are encoded EDGE_BATCH_SIZE at a time, give the same document, and the model keeps no edge list
+        """
+        import arch.crawler as crawler
+
+        monkeypatch.setattr(crawler, "EDGE_BATCH_SIZE", 3)
+        model = crawl_package(str(Path(__file__).parent / "data"), workers=1)
+        writes = []
+
+        class Recorder(io.BytesIO):
+            def write(self, data):
+                writes.append(data)
+                return super().write(data)
+
+        buf = Recorder()
+        write_json(model, buf)
+        assert model._edges is None
+        assert json.loads(buf.getvalue()) == model.to_dict()
+
+        # the writes between the opening and closing of the "edges" array are the batches
+        start = next(i for i, data in enumerate(writes) if data.endswith(b'"edges":[')) + 1
+        batches = [json.loads(b"[" + data.lstrip(b",") + b"]") for data in writes[start:-1]]
+        n_edges = len(model.build_edges())
+        assert [len(b) for b in batches] == [3] * (n_edges // 3) + ([n_edges % 3] if n_edges % 3 else [])
+
+    @pytest.mark.optional_package
+    def test_orjson_and_stdlib_encoders_agree(self, monkeypatch):
+        """
+        the orjson fast path and the stdlib fallback produce the same JSON document
+        """
+        pytest.importorskip("orjson")
+        import arch.crawler as crawler
+
+        model = crawl_package(str(Path(__file__).parent / "data" / "relations"), workers=1)
+        fast = crawler.to_json_bytes(model)
+        monkeypatch.setattr(crawler, "orjson", None)
+        slow = crawler.to_json_bytes(model)
+        assert json.loads(fast) == json.loads(slow)
+
+
+class TestParseCache:
+    def test_unchanged_files_are_served_from_cache(self, tmp_path: Path, monkeypatch):
+        """
+        a second crawl with the same cache file does not parse unchanged files, but re-parses edited ones
+        """
+        root = tmp_path / "src"
+        pkg = root / "pkg"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").touch()
+        mod = pkg / "m.py"
+        mod.write_text("class A:\n    pass\n", encoding="utf-8")
+        cache_path = str(tmp_path / "cache" / "parse_cache.json")
+
+        first = crawl_package(str(root), workers=1, cache_path=cache_path)
+
+        parsed = []
+        original = Module.get_tree
+        monkeypatch.setattr(Module, "get_tree", staticmethod(lambda path, source=None: parsed.append(path) or original(path, source)))
+        second = crawl_package(str(root), workers=1, cache_path=cache_path)
+        assert parsed == []
+        assert second.to_dict()["modules"] == first.to_dict()["modules"]
+
+        mod.write_text("class A:\n    pass\n\n\nclass B(A):\n    pass\n", encoding="utf-8")
+        third = crawl_package(str(root), workers=1, cache_path=cache_path)
+        assert parsed == [str(mod)]
+        assert [c.name for c in third.modules["pkg.m"].classes] == ["A", "B"]
+
+    def test_touched_files_with_same_content_are_served_from_cache(self, tmp_path: Path, monkeypatch):
+        """
+        a new mtime alone (fresh clone, checkout, touch) does not trigger a re-parse when the bytes are unchanged
+        """
+        root = tmp_path / "src"
+        root.mkdir()
+        mod = root / "m.py"
+        mod.write_text("def f():\n    pass\n", encoding="utf-8")
+        cache_path = str(tmp_path / "parse_cache.json")
+        crawl_package(str(root), workers=1, cache_path=cache_path)
+
+        parsed = []
+        original = Module.get_tree
+        monkeypatch.setattr(Module, "get_tree", staticmethod(lambda path, source=None: parsed.append(path) or original(path, source)))
+        st = mod.stat()
+        os.utime(mod, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        model = crawl_package(str(root), workers=1, cache_path=cache_path)
+        assert parsed == []
+        assert [f.name for f in model.modules["m"].functions] == ["f"]
+
+        mod.write_text("def g():\n    pass\n", encoding="utf-8")  # same size, different bytes
+        os.utime(mod, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+        model = crawl_package(str(root), workers=1, cache_path=cache_path)
+        assert parsed == [str(mod)]
+        assert [f.name for f in model.modules["m"].functions] == ["g"]
+
+    def test_hit_and_miss_counters(self, tmp_path: Path):
+        """
+        the cache counts lookups it served and lookups that fell through to the parser
+        """
+        root = tmp_path / "src"
+        root.mkdir()
+        for name in ("a", "b"):
+            (root / f"{name}.py").write_text(f"def {name}():\n    pass\n", encoding="utf-8")
+        cache_path = str(tmp_path / "parse_cache.json")
+        crawl_package(str(root), workers=1, cache_path=cache_path)
+        (root / "c.py").write_text("def c():\n    pass\n", encoding="utf-8")
+
+        cache = _ParseCache.load(cache_path)
+        for entry, dotted_name in _iter_python_files(str(root)):
+            cache.get(entry, dotted_name)
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_cold_crawl_digests_the_bytes_it_parsed(self, tmp_path: Path, monkeypatch):
+        """
+        parsed files are not read a second time to fill the cache; the entry matches the file that was parsed
+        """
+        import arch.crawler as crawler
+
+        root = tmp_path / "src"
+        root.mkdir()
+        mod = root / "m.py"
+        mod.write_text("def f():\n    pass\n", encoding="utf-8")
+        cache_path = str(tmp_path / "parse_cache.json")
+
+        def no_second_read(path):
+            raise AssertionError(f"{path} was read again")
+
+        monkeypatch.setattr(crawler, "_file_digest", no_second_read)
+        crawl_package(str(root), workers=1, cache_path=cache_path)
+
+        st = mod.stat()
+        mtime_ns, size, digest, _ = _ParseCache.load(cache_path).entries[str(mod)]
+        assert (mtime_ns, size, digest) == (st.st_mtime_ns, st.st_size, crawler._digest(mod.read_bytes()))
+
+    @pytest.mark.parametrize(
+        "entries",
+        [[], {"m.py": "not a list"}, {"m.py": [1, 2, "digest"]}, {"m.py": [1, "2", "digest", {}]}],
+    )
+    def test_malformed_entries_give_a_cold_cache(self, tmp_path: Path, entries):
+        """
+        a cache file with the right version but malformed entries is discarded instead of failing the crawl
+        """
+        root = tmp_path / "src"
+        root.mkdir()
+        (root / "m.py").write_text("def f():\n    pass\n", encoding="utf-8")
+        cache_path = tmp_path / "parse_cache.json"
+        cache_path.write_text(json.dumps({"version": _ParseCache.VERSION, "entries": entries}), encoding="utf-8")
+
+        assert _ParseCache.load(str(cache_path)).entries == {}
+        model = crawl_package(str(root), workers=1, cache_path=str(cache_path))
+        assert [f.name for f in model.modules["m"].functions] == ["f"]
+
+
+class TestGetTreePrefilter:
+    def test_blank_files_yield_empty_modules(self, tmp_path: Path):
+        """
+        empty and whitespace-only files produce an empty module without being parsed, data-only files by parsing
+        """
+        (tmp_path / "empty.py").write_bytes(b"")
+        (tmp_path / "blank.py").write_bytes(b"\n  \n\t\n")
+        (tmp_path / "data.py").write_text('__all__ = ["a", "b"]\nVALUE = 3\n', encoding="utf-8")
+        for name in ("empty", "blank", "data"):
+            mod = Module.from_file(str(tmp_path / f"{name}.py"), str(tmp_path))
+            assert (mod.name, mod.classes, mod.functions, mod.imports) == (name, [], [], [])
+
+    def test_files_with_definitions_are_parsed(self, tmp_path: Path):
+        """
+        files with definitions and imports are parsed, however short they are
+        """
+        (tmp_path / "m.py").write_text("import os\nasync def f():\n    pass\n", encoding="utf-8")
+        (tmp_path / "t.py").write_text("import x", encoding="utf-8")
+        mod = Module.from_file(str(tmp_path / "m.py"), str(tmp_path))
+        assert [f.name for f in mod.functions] == ["f"]
+        assert mod.imports == ["os"]
+        assert Module.from_file(str(tmp_path / "t.py"), str(tmp_path)).imports == ["x"]
+
+    def test_invalid_syntax_is_skipped_even_without_keywords(self, tmp_path: Path):
+        """
+        a short file with a syntax error and no def/class/import keyword is skipped, like any unparsable file
+        """
+        (tmp_path / "bad.py").write_text("x = (\n", encoding="utf-8")
+        assert Module.from_file(str(tmp_path / "bad.py"), str(tmp_path)) is None
+
+
+class TestCrawlPackageFast:
+    @staticmethod
+    def _shape(model):
+        # everything the line scan records; decorators are only collected by the full parse
+        return {
+            name: (
+                [(c.name, c.lineno, c.bases, [(m.name, m.lineno) for m in c.methods]) for c in mod.classes],
+                [(f.name, f.lineno) for f in mod.functions],
+                mod.imports,
+            )
+            for name, mod in model.modules.items()
+        }
+
+    def test_fast_crawl_matches_full_parse_on_test_data(self):
+        """
+        the line scan finds the same classes, methods, functions and imports as the ast parse on the test data
+        """
+        root = str(Path(__file__).parent / "data")
+        full = crawl_package(root, workers=1)
+        fast = crawl_package(root, workers=1, fast=True)
+        assert self._shape(fast) == self._shape(full)
+
+    def test_fast_scan_skips_nested_defs_and_relative_package_imports(self, tmp_path: Path):
+        """
+        functions nested in methods are not methods, "from . import x" records nothing, aliases are dropped
+        """
+        (tmp_path / "m.py").write_text(
+            "import os.path as osp, sys\n"
+            "from . import sibling\n"
+            "from .pkg import thing\n"
+            "class A(Generic[T], metaclass=Meta):\n"
+            "    def run(self):\n"
+            "        def helper():\n"
+            "            pass\n"
+            "    async def stop(self):\n"
+            "        pass\n",
+            encoding="utf-8",
+        )
+        mod = crawl_package(str(tmp_path), workers=1, fast=True).modules["m"]
+        assert mod.imports == ["os.path", "sys", "pkg"]
+        assert mod.classes[0].bases == ["Generic"]
+        assert [m.name for m in mod.classes[0].methods] == ["run", "stop"]
+
+    def test_column_zero_statement_ends_the_class_body(self, tmp_path: Path):
+        """
+        a def indented under a top-level "if" after a class is not a method of that class, as in the ast parse;
+        closing brackets of a multi-line class header and column-0 comments do not end the class
+        """
+        (tmp_path / "m.py").write_text(
+            "class A:\n"
+            "    def m(self): pass\n"
+            "if True:\n"
+            "    def f(): pass\n"
+            "class B(\n"
+            "    Base,\n"
+            "):\n"
+            "# note\n"
+            "    def n(self): pass\n",
+            encoding="utf-8",
+        )
+        full = crawl_package(str(tmp_path), workers=1)
+        fast = crawl_package(str(tmp_path), workers=1, fast=True)
+        methods = {c.name: [m.name for m in c.methods] for c in fast.modules["m"].classes}
+        assert methods == {"A": ["m"], "B": ["n"]}
+        assert methods == {c.name: [m.name for m in c.methods] for c in full.modules["m"].classes}
+
+    def test_first_body_statement_sets_the_method_indent(self, tmp_path: Path):
+        """
+        a nested class or an "if" opening the class body does not make its deeper defs the class methods
+        """
+        (tmp_path / "m.py").write_text(
+            "class A:\n"
+            "    class Meta:\n"
+            "        def inner(self): pass\n"
+            "    def real(self): pass\n"
+            "    def other(self): pass\n"
+            "class B:\n"
+            "    if True:\n"
+            "        def hidden(self): pass\n"
+            "    def shown(self): pass\n",
+            encoding="utf-8",
+        )
+        full = crawl_package(str(tmp_path), workers=1)
+        fast = crawl_package(str(tmp_path), workers=1, fast=True)
+        methods = {c.name: [m.name for m in c.methods] for c in fast.modules["m"].classes}
+        assert methods == {"A": ["real", "other"], "B": ["shown"]}
+        assert methods == {c.name: [m.name for m in c.methods] for c in full.modules["m"].classes}
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+
+from arch.crawler import crawl_package
+from arch.mermaid import render_class_diagram, render_function_diagram, render_module_diagram
+
+
+def _body(diagram: str):
+    return diagram.splitlines()[1:]
+
+
+class TestRenderModuleDiagram:
+    def test_module_diagram_is_the_class_and_function_diagrams_combined(self):
+        """Inputs: Every module crawled from tests/data/test-package-1, rendered without relations or styling.
+        Expected: The module diagram body is the bodies of its class diagrams (sorted by name) followed by the
+        bodies of its function diagrams (sorted by name).
+        Checks: Emitting the nested parts into one list matches rendering them separately.
+        """
+        model = crawl_package(str(Path(__file__).parent / "data" / "test-package-1"), workers=1)
+        for mod in model.modules.values():
+            expected = ["classDiagram"]
+            for cls in sorted(mod.classes, key=lambda c: c.name):
+                expected += _body(render_class_diagram(cls, include_relations=False))
+            for func in sorted(mod.functions, key=lambda f: f.name):
+                expected += _body(render_function_diagram(func, include_decorators=True))
+            assert render_module_diagram(mod, include_relations=False).splitlines() == expected
+
+    def test_unsupported_detail_level_is_rejected(self):
+        """Inputs: An unknown detail level for the function, class and module renderers.
+        Expected: ValueError naming the offending argument.
+        Checks: Argument validation happens before any output is produced.
+        """
+        model = crawl_package(str(Path(__file__).parent / "data" / "relations"), workers=1)
+        mod = model.modules["base"]
+        with pytest.raises(ValueError, match="Unsupported detail_level 'some'"):
+            render_class_diagram(mod.classes[0], detail_level="some")
+        with pytest.raises(ValueError, match="Unsupported function_detail_level 'some'"):
+            render_module_diagram(mod, function_detail_level="some")
+
+
+class TestDeduplicatedLines:
+    def test_repeated_relations_and_imports_are_emitted_once_in_first_seen_order(self):
+        """Inputs: Two modules declaring classes with the same (base, class) pair, and a module importing os twice.
+        Expected: Each inheritance line and each dependency line appears once, in the order first encountered.
+        Checks: Deduplication keeps the output order stable.
+        """
+        from arch.data_models import Class, Module, Package
+        from arch.mermaid import render_module_dependency, render_package_diagram
+
+        a = Module(name="a", path="a.py", classes=[Class("C", 1, bases=["Z", "B"])], imports=["os", "sys", "os"])
+        b = Module(name="b", path="b.py", classes=[Class("C", 1, bases=["B"])])
+        diagram = render_package_diagram(Package(root_path="/", roots=[], modules={"b": b, "a": a}))
+        assert [ln for ln in diagram.splitlines() if "<|--" in ln] == ["Z <|-- C", "B <|-- C"]
+        assert render_module_dependency(a).splitlines()[1:] == ["a ..> os : imports", "a ..> sys : imports"]
+
+
+class TestStyle:
+    def test_shared_style_is_not_renamed_by_rendering(self):
+        """Inputs: One Style instance used to render two modules with different names.
+        Expected: Each diagram carries its own module name, and the Style keeps its original name.
+        Checks: apply_style takes the module name as an argument instead of assigning it to the Style.
+        """
+        from arch.data_models import Class, Module
+        from arch.mermaid import Style
+
+        style = Style(name="shared")
+        a = Module(name="pkg.a", path="a.py", classes=[Class("A", 1)])
+        b = Module(name="pkg.b", path="b.py", classes=[Class("B", 1)])
+
+        diagram_a = render_module_diagram(a, style=style)
+        diagram_b = render_module_diagram(b, style=style)
+        assert "class A:::pkg_a_style" in diagram_a and 'note for A "module: pkg.a"' in diagram_a
+        assert "class B:::pkg_b_style" in diagram_b and "pkg.a" not in diagram_b
+        assert style.name == "shared"
+        assert style.apply_style(["X"])[-1] == 'note for X "module: shared"'
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from arch.crawler import crawl_package
+from arch.viewer import render_tree
+
+
+class TestRenderTree:
+    def test_package_and_dict_render_the_same(self):
+        """Inputs: A Package crawled from tests/data/test-package-1 and its to_dict() form.
+        Expected: render_tree gives the same text for both inputs.
+        Checks: Package objects (as returned by crawl_package and used by the CLI) are accepted directly.
+        """
+        model = crawl_package(str(Path(__file__).parent / "data" / "test-package-1"), workers=1)
+        assert render_tree(model) == render_tree(model.to_dict())
+
+    def test_module_order_does_not_matter(self):
+        """Inputs: The modules of tests/data in sorted order and in reverse order (submodules before packages).
+        Expected: Both dicts render to the same text.
+        Checks: Nodes created for a submodule are reused when its parent package is inserted later.
+        """
+        modules = crawl_package(str(Path(__file__).parent / "data"), workers=1).to_dict()["modules"]
+        reversed_modules = dict(reversed(list(modules.items())))
+        assert render_tree({"roots": [], "modules": modules}) == render_tree({"roots": [], "modules": reversed_modules})
+
+    def test_deep_tree_does_not_recurse(self):
+        """Inputs: A single module nested far deeper than the interpreter recursion limit.
+        Expected: The tree renders with one line per level plus the header and the function line.
+        Checks: The iterative traversal handles arbitrary depth.
+        """
+        depth = 3000
+        name = ".".join(f"p{i}" for i in range(depth))
+        mod = {"name": name, "path": "X", "classes": [], "functions": [{"name": "f"}], "imports": []}
+        out = render_tree({"roots": ["p0"], "modules": {name: mod}})
+        lines = out.splitlines()
+        assert lines[0] == "Package roots: p0"
+        assert len(lines) == 1 + depth + 1
+        assert lines[-1].endswith("└─ def f()")
+
+    def test_empty_model(self):
+        """Inputs: A model without modules.
+        Expected: Only the header line, terminated by a newline.
+        Checks: Output format for the degenerate case.
+        """
+        assert render_tree({"roots": [], "modules": {}}) == "Package roots: \n"
+
+    def test_connectors_for_siblings_and_members(self):
+        """Inputs: A package module with a function and two submodules, one holding a class with two methods.
+        Expected: Siblings are listed in sorted order, with "├─" for all but the last entry of a level and "└─"
+        for the last; members of a class are indented under a "│" rail.
+        Checks: The exact tree text, including the connector of each line.
+        """
+        def mod(name, classes=(), functions=()):
+            return {"name": name, "path": "X", "classes": list(classes), "functions": list(functions), "imports": []}
+
+        cls = {"name": "A", "bases": [], "methods": [{"name": "m"}, {"name": "n"}]}
+        modules = {
+            "pkg": mod("pkg", functions=[{"name": "f"}]),
+            "pkg.b": mod("pkg.b", classes=[cls]),
+            "pkg.a": mod("pkg.a"),
+        }
+        assert render_tree({"roots": ["pkg"], "modules": modules}).splitlines() == [
+            "Package roots: pkg",
+            "└─ pkg",
+            "   ├─ def f()",
+            "   ├─ a",
+            "   └─ b",
+            "      ├─ class A (bases: object)",
+            "      │  ├─ def m()",
+            "      │  └─ def n()",
+        ]